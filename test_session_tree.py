@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Regression test for the SSH dialog's session tree vs the Session Manager.
+
+Both dialogs put a SessionTreeModel over the same config.session_folders
+list. Deleting a folder in the Session Manager while the SSH dialog has
+it expanded used to leave the SSH dialog's view holding indexes into the
+freed folder; the next repaint segfaulted.
+
+Run this standalone (uses a throwaway HOME, offscreen Qt):
+    python test_session_tree.py
+"""
+
+import os
+import sys
+import tempfile
+
+os.environ["HOME"] = tempfile.mkdtemp(prefix="vtqt-test-")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtWidgets import QApplication, QMessageBox
+except ImportError:
+    print("ERROR: PyQt6 not installed. Run: pip install PyQt6")
+    sys.exit(1)
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from vtqt import session_manager
+from vtqt.config_manager import get_config, SessionFolder, SessionInfo
+from vtqt.ssh_dialog import SSHConnectionDialog
+
+
+def _seed_sessions():
+    """Two folders, three sessions each."""
+    config = get_config()
+    config.session_folders = [
+        SessionFolder(
+            folder_name=f"F{i}",
+            sessions=[SessionInfo(display_name=f"s{i}{j}", host=f"10.0.{i}.{j}") for j in range(3)],
+        )
+        for i in (1, 2)
+    ]
+    config.save_sessions()
+
+
+def test_delete_expanded_folder_in_manager():
+    """Expand F2 in the SSH dialog, delete F2 in the manager, repaint."""
+    print("\n" + "=" * 60)
+    print("Delete expanded folder via Session Manager")
+    print("=" * 60)
+
+    _seed_sessions()
+    dialog = SSHConnectionDialog()
+    dialog.show()
+    app.processEvents()
+
+    model = dialog._session_model
+    tree = dialog._session_tree
+    f2 = model.index(1, 0)
+    tree.expand(f2)
+    tree.setCurrentIndex(model.index(1, 0, f2))
+    tree.viewport().repaint()
+    print("✓ Expanded F2 in SSH dialog")
+
+    def run_manager(manager):
+        # Stand-in for the user: select F2, delete it, let the parent repaint
+        manager._flush_selection()
+        manager._current_session = None
+        manager._current_folder = "F2"
+        manager._delete_selected()
+        tree.viewport().repaint()
+        app.processEvents()
+        manager.done(0)
+        return 0
+
+    orig_exec = session_manager.SessionManagerDialog.exec
+    orig_question = QMessageBox.question
+    session_manager.SessionManagerDialog.exec = run_manager
+    QMessageBox.question = staticmethod(lambda *a, **k: QMessageBox.StandardButton.Yes)
+    try:
+        dialog._open_session_manager()
+    finally:
+        session_manager.SessionManagerDialog.exec = orig_exec
+        QMessageBox.question = orig_question
+
+    tree.viewport().repaint()
+    app.processEvents()
+    print("✓ Repainted after delete")
+
+    names = [model.index(r, 0).data() for r in range(model.rowCount())]
+    dialog.done(0)
+    if names != ["F1"]:
+        print(f"✗ Expected ['F1'], tree shows {names}")
+        return False
+    print("✓ Tree shows remaining folder only")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_delete_expanded_folder_in_manager()
+    print()
+    print("All tests passed!" if ok else "Some tests failed - check output above.")
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test script for SSHSession end-of-session signalling.
+
+Runs a throwaway paramiko server on 127.0.0.1. In the first test its
+shell prints a line, sends EOF and then leaves the channel open. The
+session's wake-up fd must stay readable and is_alive must go False once
+that output is consumed, otherwise a QSocketNotifier consumer
+(TerminalWindow._on_ssh_ready) never sees the disconnect. The second
+test drops a live session without close() and expects its finalizer to
+release the connection and stop the reader thread.
+
+Run this standalone:
+    python test_ssh_session.py
+"""
+
+import gc
+import select
+import socket
+import sys
+import threading
+import time
+
+try:
+    import paramiko
+except ImportError:
+    print("ERROR: paramiko not installed. Run: pip install paramiko")
+    sys.exit(1)
+
+from vtqt.ssh_session import SSHSession
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Local test server
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _EofServer(paramiko.ServerInterface):
+    """Accepts any password; the shell says goodbye, then sends EOF only."""
+
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED
+
+    def check_channel_pty_request(self, *args):
+        return True
+
+    def check_channel_shell_request(self, channel):
+        threading.Thread(target=self._shell, args=(channel,), daemon=True).start()
+        return True
+
+    def _shell(self, channel):
+        channel.sendall(b"bye\r\n")
+        channel.send_exit_status(0)
+        channel.shutdown_write()  # EOF; the channel itself stays open
+
+
+class _IdleServer(_EofServer):
+    """Shell prints a prompt and stays open."""
+
+    def _shell(self, channel):
+        channel.sendall(b"$ ")
+
+
+def _start_server(server_cls=_EofServer) -> int:
+    """Serve one connection on an ephemeral port and return the port."""
+    host_key = paramiko.RSAKey.generate(2048)
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+
+    def accept():
+        conn, _ = listener.accept()
+        transport = paramiko.Transport(conn)
+        transport.add_server_key(host_key)
+        transport.start_server(server=server_cls())
+
+    threading.Thread(target=accept, daemon=True).start()
+    return listener.getsockname()[1]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_eof_before_close():
+    """Consume output the way _on_ssh_ready does until the session ends."""
+    print("\n" + "=" * 60)
+    print("EOF before channel close")
+    print("=" * 60)
+
+    session = SSHSession()
+    session.connect("127.0.0.1", port=_start_server(), username="test",
+                    password="test", auth_method="password")
+    print(f"✓ Connected to {session.connection_string}")
+
+    received = b""
+    ended = False
+    deadline = time.monotonic() + 10
+    try:
+        while time.monotonic() < deadline:
+            readable, _, _ = select.select([session.fd], [], [], 5.0)
+            if not readable:
+                break  # Wake-up lost
+            if not session.is_alive:
+                ended = True
+                break
+            received += session.read(65536)
+    finally:
+        session.close()
+
+    if b"bye" not in received:
+        print(f"✗ Output lost: {received!r}")
+        return False
+    print("✓ Read output sent before EOF")
+
+    if not ended:
+        print("✗ Never saw the session end (fd went quiet while is_alive)")
+        return False
+    print("✓ fd stayed readable and is_alive went False after EOF")
+    return True
+
+
+def test_dropped_session_released():
+    """A live session garbage-collected without close() shuts down."""
+    print("\n" + "=" * 60)
+    print("Dropped session without close()")
+    print("=" * 60)
+
+    session = SSHSession()
+    session.connect("127.0.0.1", port=_start_server(_IdleServer), username="test",
+                    password="test", auth_method="password")
+    finalizer = session._finalizer
+    channel = session._channel
+    reader = session._read_thread
+    print(f"✓ Connected to {session.connection_string}")
+
+    del session
+    gc.collect()
+    reader.join(timeout=5.0)
+
+    if finalizer.alive:
+        print("✗ Session was not collected (reader thread still references it)")
+        return False
+    print("✓ Finalizer ran")
+
+    if not channel.closed or reader.is_alive():
+        print(f"✗ Not released: channel closed={channel.closed}, reader alive={reader.is_alive()}")
+        return False
+    print("✓ Channel closed and reader thread exited")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_eof_before_close()
+    ok = test_dropped_session_released() and ok
+    print()
+    print("All tests passed!" if ok else "Some tests failed - check output above.")
+    sys.exit(0 if ok else 1)
@@ -10,19 +10,36 @@ Files:
 
 import os
 import sys
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field, asdict
 import yaml
 
+# libyaml-backed loader/dumper when PyYAML was built with it (much faster)
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+
+# Login name used when a session or credential gives none; the one
+# fallback shared by the dialogs and SSHSession
+DEFAULT_USER = os.environ.get('USER') or 'root'
+
+
+def _intern(value):
+    """Intern YAML-parsed strings that are compared against literals."""
+    return sys.intern(value) if isinstance(value, str) else value
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Data Classes
 # ─────────────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SessionInfo:
-    """SSH session definition."""
+    """SSH session definition (immutable; edits replace the instance)."""
     display_name: str
     host: str
     port: str = "22"
@@ -38,24 +55,35 @@ class SessionInfo:
     auth_method: str = "password"  # password, key, agent
     key_file: str = ""
 
-    def get_port_int(self) -> int:
-        """Get port as integer."""
+    # Derived once at construction: parsed port, tree label and tooltip
+    port_int: int = field(init=False, repr=False, compare=False)
+    label: str = field(init=False, repr=False, compare=False)
+    tooltip: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
         try:
-            return int(self.port)
+            port_int = int(self.port)
         except (ValueError, TypeError):
-            return 22
+            port_int = 22
+        object.__setattr__(self, 'port_int', port_int)
+        object.__setattr__(self, 'label', self.display_name or self.host)
+        object.__setattr__(self, 'tooltip', f"{self.host}:{self.port}")
 
+    def get_port_int(self) -> int:
+        """Get port as integer."""
+        return self.port_int
 
-@dataclass
+
+@dataclass(slots=True)
 class SessionFolder:
     """Folder containing sessions."""
     folder_name: str
     sessions: List[SessionInfo] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Credential:
-    """Credential set for session authentication."""
+    """Credential set for session authentication (immutable; edits replace the instance)."""
     id: str
     name: str
     username: str
@@ -137,6 +165,25 @@ class ConfigManager:
         self.session_folders: List[SessionFolder] = []
         self.credentials: List[Credential] = []
 
+        # (st_mtime_ns, st_size) of each file as last loaded/saved; locked
+        # because write_sessions_data() records its stamp on a pool thread
+        self._file_stamps: Dict[Path, tuple] = {}
+        self._stamp_lock = threading.Lock()
+
+        # Bumped whenever sessions/credentials are (re)loaded or saved,
+        # so views built from them can tell when they're stale (GUI thread only)
+        self.sessions_version = 0
+        self.credentials_version = 0
+
+        # (host, port) -> [(folder, session), ...], rebuilt lazily when
+        # sessions_version moves past _session_index_version
+        self._session_index: Dict[Tuple[str, str], List[Tuple[SessionFolder, SessionInfo]]] = {}
+        self._session_index_version = -1
+
+        # credential id -> Credential, rebuilt lazily like _session_index
+        self._credential_index: Dict[str, Credential] = {}
+        self._credential_index_version = -1
+
         # Ensure config dir exists
         self._ensure_config_dir()
 
@@ -157,7 +204,7 @@ class ConfigManager:
             default_settings = AppSettings()
             try:
                 with open(self.settings_file, 'w') as f:
-                    yaml.dump(asdict(default_settings), f, default_flow_style=False)
+                    yaml.dump(asdict(default_settings), f, Dumper=YamlDumper, default_flow_style=False)
                 print(f"Created default settings: {self.settings_file}")
             except Exception as e:
                 print(f"Warning: Could not create default settings: {e}", file=sys.stderr)
@@ -182,7 +229,7 @@ class ConfigManager:
             ]
             try:
                 with open(self.sessions_file, 'w') as f:
-                    yaml.dump(default_sessions, f, default_flow_style=False, sort_keys=False)
+                    yaml.dump(default_sessions, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
                 print(f"Created default sessions: {self.sessions_file}")
             except Exception as e:
                 print(f"Warning: Could not create default sessions: {e}", file=sys.stderr)
@@ -193,13 +240,13 @@ class ConfigManager:
                 {
                     'id': '1',
                     'name': 'Default',
-                    'username': os.environ.get('USER', 'admin'),
+                    'username': DEFAULT_USER,
                     'auth_method': 'agent',  # Safe default - uses SSH agent
                 }
             ]
             try:
                 with open(self.credentials_file, 'w') as f:
-                    yaml.dump(default_creds, f, default_flow_style=False)
+                    yaml.dump(default_creds, f, Dumper=YamlDumper, default_flow_style=False)
                 os.chmod(self.credentials_file, 0o600)
                 print(f"Created default credentials: {self.credentials_file}")
             except Exception as e:
@@ -209,11 +256,40 @@ class ConfigManager:
     # Load/Save
     # ─────────────────────────────────────────────────────────────
 
-    def load(self):
+    @staticmethod
+    def _stat_key(path: Path) -> Optional[tuple]:
+        """Cheap change key for a file, or None if missing."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _is_cached(self, path: Path) -> bool:
+        """True if path hasn't changed since we last loaded/saved it."""
+        key = self._stat_key(path)
+        with self._stamp_lock:
+            return key is not None and self._file_stamps.get(path) == key
+
+    def _mark_cached(self, path: Path):
+        """Remember path's current stat key."""
+        key = self._stat_key(path)
+        with self._stamp_lock:
+            if key is None:
+                self._file_stamps.pop(path, None)
+            else:
+                self._file_stamps[path] = key
+
+    def _forget_cached(self, path: Path):
+        """Force the next load of path to re-parse it."""
+        with self._stamp_lock:
+            self._file_stamps.pop(path, None)
+
+    def load(self, force: bool = False):
         """Load all configuration files."""
         self.load_settings()
-        self.load_sessions()
-        self.load_credentials()
+        self.load_sessions(force)
+        self.load_credentials(force)
 
     def save(self):
         """Save all configuration files."""
@@ -229,7 +305,7 @@ class ConfigManager:
 
         try:
             with open(self.settings_file, 'r') as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=YamlLoader) or {}
 
             self.settings = AppSettings(**{
                 k: v for k, v in data.items()
@@ -243,19 +319,28 @@ class ConfigManager:
         """Save settings to settings.yaml."""
         try:
             with open(self.settings_file, 'w') as f:
-                yaml.dump(asdict(self.settings), f, default_flow_style=False)
+                yaml.dump(asdict(self.settings), f, Dumper=YamlDumper, default_flow_style=False)
         except Exception as e:
             print(f"Warning: Could not save settings: {e}", file=sys.stderr)
 
-    def load_sessions(self):
-        """Load sessions from sessions.yaml."""
+    def load_sessions(self, force: bool = False):
+        """
+        Load sessions from sessions.yaml.
+
+        Skips the YAML parse if the file is unchanged since the last
+        load/save, unless force is set.
+        """
+        if not force and self._is_cached(self.sessions_file):
+            return
+
+        self.sessions_version += 1
         if not self.sessions_file.exists():
             self.session_folders = []
             return
 
         try:
             with open(self.sessions_file, 'r') as f:
-                data = yaml.safe_load(f) or []
+                data = yaml.load(f, Loader=YamlLoader) or []
 
             self.session_folders = []
             for folder_data in data:
@@ -275,64 +360,94 @@ class ConfigManager:
                         SoftwareVersion=session_data.get('SoftwareVersion', ''),
                         credsid=str(session_data.get('credsid', '')),
                         username=session_data.get('username', ''),
-                        auth_method=session_data.get('auth_method', 'password'),
+                        auth_method=_intern(session_data.get('auth_method', 'password')),
                         key_file=session_data.get('key_file', ''),
                     )
                     folder.sessions.append(session)
 
                 self.session_folders.append(folder)
 
+            self._mark_cached(self.sessions_file)
+
         except Exception as e:
             print(f"Warning: Could not load sessions: {e}", file=sys.stderr)
             self.session_folders = []
-
-    def save_sessions(self):
-        """Save sessions to sessions.yaml."""
-        try:
-            data = []
-            for folder in self.session_folders:
-                folder_data = {
-                    'folder_name': folder.folder_name,
-                    'sessions': []
+            self._forget_cached(self.sessions_file)
+
+    def save_sessions(self) -> bool:
+        """Save sessions to sessions.yaml. Returns False if the write failed."""
+        if not self.write_sessions_data(self.sessions_data()):
+            return False
+        self.sessions_version += 1
+        return True
+
+    def sessions_data(self) -> List[Dict[str, Any]]:
+        """Snapshot session_folders as plain YAML-ready data."""
+        data = []
+        for folder in self.session_folders:
+            folder_data = {
+                'folder_name': folder.folder_name,
+                'sessions': []
+            }
+            for session in folder.sessions:
+                session_data = {
+                    'display_name': session.display_name,
+                    'host': session.host,
+                    'port': session.port,
+                    'DeviceType': session.DeviceType,
+                    'Model': session.Model,
+                    'Vendor': session.Vendor,
+                    'SerialNumber': session.SerialNumber,
+                    'SoftwareVersion': session.SoftwareVersion,
+                    'credsid': session.credsid,
                 }
-                for session in folder.sessions:
-                    session_data = {
-                        'display_name': session.display_name,
-                        'host': session.host,
-                        'port': session.port,
-                        'DeviceType': session.DeviceType,
-                        'Model': session.Model,
-                        'Vendor': session.Vendor,
-                        'SerialNumber': session.SerialNumber,
-                        'SoftwareVersion': session.SoftwareVersion,
-                        'credsid': session.credsid,
-                    }
-                    # Only include optional fields if set
-                    if session.username:
-                        session_data['username'] = session.username
-                    if session.auth_method != 'password':
-                        session_data['auth_method'] = session.auth_method
-                    if session.key_file:
-                        session_data['key_file'] = session.key_file
-
-                    folder_data['sessions'].append(session_data)
-                data.append(folder_data)
+                # Only include optional fields if set
+                if session.username:
+                    session_data['username'] = session.username
+                if session.auth_method != 'password':
+                    session_data['auth_method'] = session.auth_method
+                if session.key_file:
+                    session_data['key_file'] = session.key_file
+
+                folder_data['sessions'].append(session_data)
+            data.append(folder_data)
+        return data
+
+    def write_sessions_data(self, data: List[Dict[str, Any]]) -> bool:
+        """
+        Write a sessions_data() snapshot to sessions.yaml.
 
+        Touches no session objects or versions (only the lock-guarded file
+        stamp), so it is safe to run off the GUI thread.
+        """
+        try:
             with open(self.sessions_file, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
+
+            self._mark_cached(self.sessions_file)
+            return True
 
         except Exception as e:
             print(f"Warning: Could not save sessions: {e}", file=sys.stderr)
+            return False
 
-    def load_credentials(self):
-        """Load credentials from credentials.yaml."""
+    def load_credentials(self, force: bool = False):
+        """
+        Load credentials from credentials.yaml.
+
+        Skips the YAML parse if the file is unchanged, unless force is set.
+        """
+        if not force and self._is_cached(self.credentials_file):
+            return
+
+        self.credentials_version += 1
         if not self.credentials_file.exists():
             self.credentials = []
             return
 
         try:
             with open(self.credentials_file, 'r') as f:
-                data = yaml.safe_load(f) or []
+                data = yaml.load(f, Loader=YamlLoader) or []
 
             self.credentials = []
             for cred_data in data:
@@ -340,16 +455,19 @@ class ConfigManager:
                     id=str(cred_data.get('id', '')),
                     name=cred_data.get('name', ''),
                     username=cred_data.get('username', ''),
-                    auth_method=cred_data.get('auth_method', 'password'),
+                    auth_method=_intern(cred_data.get('auth_method', 'password')),
                     password=cred_data.get('password', ''),
                     key_file=cred_data.get('key_file', ''),
                     key_passphrase=cred_data.get('key_passphrase', ''),
                 )
                 self.credentials.append(cred)
 
+            self._mark_cached(self.credentials_file)
+
         except Exception as e:
             print(f"Warning: Could not load credentials: {e}", file=sys.stderr)
             self.credentials = []
+            self._forget_cached(self.credentials_file)
 
     def save_credentials(self):
         """Save credentials to credentials.yaml."""
@@ -372,9 +490,11 @@ class ConfigManager:
 
             # Set restrictive permissions for credentials file
             with open(self.credentials_file, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False)
+                yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False)
 
             os.chmod(self.credentials_file, 0o600)
+            self._mark_cached(self.credentials_file)
+            self.credentials_version += 1
 
         except Exception as e:
             print(f"Warning: Could not save credentials: {e}", file=sys.stderr)
@@ -385,10 +505,17 @@ class ConfigManager:
 
     def get_credential(self, creds_id: str) -> Optional[Credential]:
         """Get credential by ID."""
-        for cred in self.credentials:
-            if cred.id == creds_id:
-                return cred
-        return None
+        if self._credential_index_version != self.credentials_version:
+            index: Dict[str, Credential] = {}
+            for cred in self.credentials:
+                index.setdefault(cred.id, cred)  # First match wins, as before
+            self._credential_index = index
+            self._credential_index_version = self.credentials_version
+        return self._credential_index.get(creds_id)
+
+    def mark_credentials_changed(self):
+        """Note an in-place edit of credentials made outside this class."""
+        self.credentials_version += 1
 
     def get_credential_for_session(self, session: SessionInfo) -> Optional[Credential]:
         """Get credential for a session."""
@@ -407,14 +534,30 @@ class ConfigManager:
             sessions.extend(folder.sessions)
         return sessions
 
+    def mark_sessions_changed(self):
+        """Note an in-place edit of session_folders made outside this class."""
+        self.sessions_version += 1
+
+    def _get_session_index(self) -> Dict[Tuple[str, str], List[Tuple[SessionFolder, SessionInfo]]]:
+        """(host, port) -> locations, rebuilt only if sessions changed."""
+        if self._session_index_version != self.sessions_version:
+            index: Dict[Tuple[str, str], List[Tuple[SessionFolder, SessionInfo]]] = {}
+            for folder in self.session_folders:
+                for session in folder.sessions:
+                    index.setdefault((session.host, session.port), []).append((folder, session))
+            self._session_index = index
+            self._session_index_version = self.sessions_version
+        return self._session_index
+
+    def locate_session(self, host: str, port: int = 22) -> Optional[Tuple[SessionFolder, SessionInfo]]:
+        """Find (folder, session) by host and port."""
+        matches = self._get_session_index().get((host, str(port)))
+        return matches[0] if matches else None
+
     def find_session(self, host: str, port: int = 22) -> Optional[SessionInfo]:
         """Find session by host and port."""
-        port_str = str(port)
-        for folder in self.session_folders:
-            for session in folder.sessions:
-                if session.host == host and session.port == port_str:
-                    return session
-        return None
+        location = self.locate_session(host, port)
+        return location[1] if location else None
 
     def add_session(self, folder_name: str, session: SessionInfo):
         """Add session to a folder (creates folder if needed)."""
@@ -429,12 +572,23 @@ class ConfigManager:
             folder = SessionFolder(folder_name=folder_name)
             self.session_folders.append(folder)
 
+        index_current = self._session_index_version == self.sessions_version
         folder.sessions.append(session)
+        self.sessions_version += 1
+
+        # Keep the host/port index in step rather than rebuilding it
+        if index_current:
+            self._session_index.setdefault((session.host, session.port), []).append((folder, session))
+            self._session_index_version = self.sessions_version
 
     def remove_session(self, host: str, port: int = 22):
         """Remove session by host and port."""
         port_str = str(port)
-        for folder in self.session_folders:
+        matches = self._get_session_index().get((host, port_str), [])
+
+        # Only folders that actually hold a match need filtering
+        touched = {id(folder): folder for folder, _ in matches}
+        for folder in touched.values():
             folder.sessions = [
                 s for s in folder.sessions
                 if not (s.host == host and s.port == port_str)
@@ -444,6 +598,7 @@ class ConfigManager:
         self.session_folders = [
             f for f in self.session_folders if f.sessions
         ]
+        self.sessions_version += 1
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -466,7 +621,7 @@ def reload_config():
     """Reload configuration from disk."""
     global _config_instance
     if _config_instance:
-        _config_instance.load()
+        _config_instance.load(force=True)
     else:
         get_config()
 
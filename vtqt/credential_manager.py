@@ -16,7 +16,12 @@ from PyQt6.QtWidgets import (
     QFileDialog, QStackedWidget, QWidget, QSplitter
 )
 
-from .config_manager import get_config, Credential
+from .config_manager import get_config, Credential, DEFAULT_USER
+from .icons import AUTH_ICONS, emoji_icon
+
+
+_HOME_DIR = os.path.expanduser("~")
+_DEFAULT_SSH_DIR = os.path.join(_HOME_DIR, ".ssh")
 
 
 class CredentialManagerDialog(QDialog):
@@ -33,6 +38,10 @@ class CredentialManagerDialog(QDialog):
         self._current_credential: Optional[Credential] = None
         self._is_new = False
 
+        # Set once anything is written to credentials.yaml, so callers
+        # can skip refreshing when the dialog was only browsed
+        self.credentials_changed = False
+
         self._setup_ui()
         self._apply_styling()
         self._load_credentials()
@@ -97,7 +106,7 @@ class CredentialManagerDialog(QDialog):
         # Username
         editor_grid.addWidget(QLabel("Username:"), row, 0)
         self._username_edit = QLineEdit()
-        self._username_edit.setPlaceholderText(os.environ.get('USER', 'username'))
+        self._username_edit.setPlaceholderText(DEFAULT_USER)
         editor_grid.addWidget(self._username_edit, row, 1, 1, 2)
         row += 1
 
@@ -264,8 +273,10 @@ class CredentialManagerDialog(QDialog):
         config.load_credentials()
 
         for cred in config.credentials:
-            auth_icon = {"password": "🔑", "key": "🔐", "agent": "🔓"}.get(cred.auth_method, "")
-            item = QListWidgetItem(f"{auth_icon} {cred.name} ({cred.username})")
+            item = QListWidgetItem(f"{cred.name} ({cred.username})")
+            glyph = AUTH_ICONS.get(cred.auth_method)
+            if glyph:
+                item.setIcon(emoji_icon(glyph))
             item.setData(Qt.ItemDataRole.UserRole, cred)
             self._cred_list.addItem(item)
 
@@ -336,17 +347,14 @@ class CredentialManagerDialog(QDialog):
 
     def _browse_key(self):
         """Browse for key file."""
-        ssh_dir = os.path.expanduser("~/.ssh")
-        if not os.path.isdir(ssh_dir):
-            ssh_dir = os.path.expanduser("~")
+        ssh_dir = _DEFAULT_SSH_DIR if os.path.isdir(_DEFAULT_SSH_DIR) else _HOME_DIR
 
         path, _ = QFileDialog.getOpenFileName(
             self, "Select SSH Private Key", ssh_dir, "All Files (*)"
         )
         if path:
-            home = os.path.expanduser("~")
-            if path.startswith(home):
-                path = "~" + path[len(home):]
+            if path.startswith(_HOME_DIR):
+                path = "~" + path[len(_HOME_DIR):]
             self._key_edit.setText(path)
 
     def _add_credential(self):
@@ -382,7 +390,9 @@ class CredentialManagerDialog(QDialog):
         if result == QMessageBox.StandardButton.Yes:
             config = get_config()
             config.credentials = [c for c in config.credentials if c.id != self._current_credential.id]
+            config.mark_credentials_changed()
             config.save_credentials()
+            self.credentials_changed = True
             self._load_credentials()
             self._clear_editor()
             self._set_editor_enabled(False)
@@ -404,7 +414,7 @@ class CredentialManagerDialog(QDialog):
 
         username = self._username_edit.text().strip()
         if not username:
-            username = os.environ.get('USER', '')
+            username = DEFAULT_USER
 
         auth_method = ["password", "key", "agent"][self._method_combo.currentIndex()]
 
@@ -436,8 +446,10 @@ class CredentialManagerDialog(QDialog):
                 if existing.id == cred_id:
                     config.credentials[i] = cred
                     break
+        config.mark_credentials_changed()
 
         config.save_credentials()
+        self.credentials_changed = True
         self._load_credentials()
 
         # Re-select the saved credential
@@ -609,7 +621,7 @@ class CredentialEditorDialog(QDialog):
         self._result_credential = Credential(
             id=cred_id,
             name=name,
-            username=username or os.environ.get('USER', ''),
+            username=username or DEFAULT_USER,
             auth_method=auth_method,
             password=self._password_edit.text() if auth_method == "password" else "",
             key_file=self._key_edit.text() if auth_method == "key" else "",
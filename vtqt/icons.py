@@ -0,0 +1,45 @@
+"""
+Icons - Emoji glyphs rendered once into cached QIcons.
+
+Used for tree/combo decorations and buttons so the glyph is shaped and
+rasterized a single time instead of on every paint of a text label.
+"""
+
+from functools import lru_cache
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon, QPixmap, QPainter
+
+
+FOLDER = "📁"
+SESSION = "🖥"
+ADD = "➕"
+DELETE = "🗑️"
+MANAGE = "🔑"
+SAVE = "💾"
+CANCEL = "↩"
+
+# Credential auth method -> glyph
+AUTH_ICONS = {"password": "🔑", "key": "🔐", "agent": "🔓"}
+
+
+@lru_cache(maxsize=None)
+def emoji_icon(glyph: str, size: int = 16) -> QIcon:
+    """
+    Render an emoji glyph into a QIcon (cached per glyph/size).
+
+    Needs a QGuiApplication, so call lazily rather than at import.
+    """
+    scale = 2  # Render at 2x so the icon stays crisp on HiDPI
+    pixmap = QPixmap(size * scale, size * scale)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    font = painter.font()
+    font.setPixelSize(int(size * scale * 0.8))
+    painter.setFont(font)
+    painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, glyph)
+    painter.end()
+
+    pixmap.setDevicePixelRatio(scale)
+    return QIcon(pixmap)
@@ -13,7 +13,7 @@ from typing import Optional, List, Dict
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PtySize:
     """Terminal size in rows and columns."""
     rows: int
@@ -11,8 +11,7 @@ PATCHED: Extended color support (256 color + true color) via SGR override.
 """
 
 from collections import deque
-from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from typing import Optional, Tuple, Union
 import numpy as np
 
 import pyte
@@ -35,8 +34,33 @@ class FixedHistoryScreen(pyte.HistoryScreen):
 
     This override intercepts those sequences and stores the color
     as an int (256) or tuple (true color) in char.fg/char.bg.
+
+    Lines scrolled off the top are packed into compact NumPy rows
+    (see pack_history_line) instead of keeping pyte's per-cell dicts.
     """
 
+    def __init__(self, columns: int, lines: int, history: int = 100, ratio: float = 0.5,
+                 default_fg: int = 0xD4D4D4, default_bg: int = 0x1E1E1E):
+        # Colors used when packing history lines (the owning buffer's defaults)
+        self.default_fg = default_fg
+        self.default_bg = default_bg
+        super().__init__(columns, lines, history=history, ratio=ratio)
+
+    def index(self):
+        """
+        Move cursor down, scrolling the top line into packed history.
+
+        Replaces HistoryScreen.index so history.top holds PackedLine
+        tuples rather than pyte line dicts.
+        """
+        top, bottom = self.margins or pyte.screens.Margins(0, self.lines - 1)
+        if self.cursor.y == bottom:
+            self.history.top.append(pack_history_line(
+                self.buffer[top], self.columns,
+                self.default_fg, self.default_bg
+            ))
+        pyte.Screen.index(self)
+
     def select_graphic_rendition(self, *attrs, **kwargs):
         """
         Handle SGR (Select Graphic Rendition) escape sequences.
@@ -225,10 +249,52 @@ def pyte_color_to_rgb(color, default: int = 0xD4D4D4) -> int:
     return default
 
 
-@dataclass
-class HistoryLine:
-    """A line stored in scrollback history."""
-    chars: List[Char]  # pyte Char objects
+# Packed history row: (char codes u32, fg rgb u32, bg rgb u32, CellAttr u8)
+PackedLine = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def char_attrs(char: Char) -> int:
+    """Convert pyte Char style flags to CellAttr bits."""
+    attrs = CellAttr.NONE
+    if char.bold:
+        attrs |= CellAttr.BOLD
+    if char.italics:
+        attrs |= CellAttr.ITALIC
+    if char.underscore:
+        attrs |= CellAttr.UNDERLINE
+    if char.blink:
+        attrs |= CellAttr.BLINK
+    if char.reverse:
+        attrs |= CellAttr.REVERSE
+    if char.strikethrough:
+        attrs |= CellAttr.STRIKE
+    return int(attrs)
+
+
+def pack_history_line(line, cols: int,
+                      default_fg: int = 0xD4D4D4,
+                      default_bg: int = 0x1E1E1E) -> PackedLine:
+    """
+    Pack a pyte line dict into four tight arrays of length cols.
+
+    Only cells pyte actually stored are visited; the rest keep the
+    blank defaults (space, default colors, no attrs).
+    """
+    codes = np.full(cols, 32, dtype=np.uint32)
+    fg = np.full(cols, default_fg, dtype=np.uint32)
+    bg = np.full(cols, default_bg, dtype=np.uint32)
+    attrs = np.zeros(cols, dtype=np.uint8)
+
+    for col, char in line.items():
+        if col >= cols:
+            continue
+        if char.data:
+            codes[col] = ord(char.data[0])
+        fg[col] = pyte_color_to_rgb(char.fg, default_fg)
+        bg[col] = pyte_color_to_rgb(char.bg, default_bg)
+        attrs[col] = char_attrs(char)
+
+    return codes, fg, bg, attrs
 
 
 class PyteTerminalBuffer:
@@ -253,8 +319,16 @@ class PyteTerminalBuffer:
         self.cols = cols
         self.scrollback_limit = scrollback_limit
 
+        # Colors
+        self.default_fg = 0xD4D4D4
+        self.default_bg = 0x1E1E1E
+        self.selection_bg = 0x264F78
+
         # Pyte screen with history (using our patched version)
-        self.screen = FixedHistoryScreen(cols, rows, history=scrollback_limit)
+        self.screen = FixedHistoryScreen(
+            cols, rows, history=scrollback_limit,
+            default_fg=self.default_fg, default_bg=self.default_bg
+        )
         self.stream = pyte.ByteStream(self.screen)
 
         # Selection in absolute line coordinates
@@ -265,11 +339,6 @@ class PyteTerminalBuffer:
         self._scroll_offset = 0
         self._auto_scroll = True
 
-        # Colors
-        self.default_fg = 0xD4D4D4
-        self.default_bg = 0x1E1E1E
-        self.selection_bg = 0x264F78
-
         # Dirty tracking
         self._dirty = True
 
@@ -349,11 +418,12 @@ class PyteTerminalBuffer:
     # Line access (unified history + active)
     # ─────────────────────────────────────────────────────────
 
-    def get_line(self, abs_row: int) -> Optional[dict]:
+    def get_line(self, abs_row: int) -> Optional[Union[dict, PackedLine]]:
         """
         Get line by absolute row number.
 
-        Returns dict mapping column -> pyte.Char, or None if out of bounds.
+        Returns a PackedLine tuple for history rows, a dict mapping
+        column -> pyte.Char for active screen rows, or None if out of bounds.
         """
         history_size = self.history_size
 
@@ -362,11 +432,8 @@ class PyteTerminalBuffer:
 
         if abs_row < history_size:
             # Line is in history
-            # history.top is a deque, oldest first
-            history_list = list(self.screen.history.top)
-            if abs_row < len(history_list):
-                return history_list[abs_row]
-            return None
+            # history.top is a deque of PackedLine, oldest first
+            return self.screen.history.top[abs_row]
 
         # Line is in active screen
         screen_row = abs_row - history_size
@@ -380,6 +447,25 @@ class PyteTerminalBuffer:
         line = self.get_line(abs_row)
         if line is None:
             return None
+
+        if isinstance(line, tuple):
+            codes, fg, bg, attrs = line
+            if col >= len(codes):
+                return self.screen.default_char
+            a = int(attrs[col])
+            f, b = int(fg[col]), int(bg[col])
+            return Char(
+                data=chr(codes[col]),
+                fg=((f >> 16) & 0xFF, (f >> 8) & 0xFF, f & 0xFF),
+                bg=((b >> 16) & 0xFF, (b >> 8) & 0xFF, b & 0xFF),
+                bold=bool(a & CellAttr.BOLD),
+                italics=bool(a & CellAttr.ITALIC),
+                underscore=bool(a & CellAttr.UNDERLINE),
+                strikethrough=bool(a & CellAttr.STRIKE),
+                reverse=bool(a & CellAttr.REVERSE),
+                blink=bool(a & CellAttr.BLINK),
+            )
+
         return line.get(col, self.screen.default_char)
 
     # ─────────────────────────────────────────────────────────
@@ -444,6 +530,11 @@ class PyteTerminalBuffer:
             start_col = c1 if row == r1 else 0
             end_col = c2 if row == r2 else self.cols - 1
 
+            if isinstance(line_dict, tuple):
+                codes = line_dict[0][start_col:end_col + 1]
+                lines.append(''.join(map(chr, codes.tolist())).rstrip())
+                continue
+
             # Extract characters
             chars = []
             for col in range(start_col, end_col + 1):
@@ -458,6 +549,53 @@ class PyteTerminalBuffer:
     # Rendering
     # ─────────────────────────────────────────────────────────
 
+    def _selected_span(self, abs_row: int) -> Optional[Tuple[int, int]]:
+        """Inclusive (start_col, end_col) selected on a row, or None."""
+        if not self.selection.active or self.selection.start_row < 0:
+            return None
+
+        r1, c1, r2, c2 = self.selection.normalize()
+        if abs_row < r1 or abs_row > r2:
+            return None
+
+        start_col = c1 if abs_row == r1 else 0
+        end_col = c2 if abs_row == r2 else self.cols - 1
+        return start_col, end_col
+
+    def _render_packed_row(self, out: np.ndarray, line: PackedLine, abs_row: int):
+        """Fill one render row from a packed history line (no per-cell Python)."""
+        codes, fg, bg, attrs = line
+        n = min(len(codes), self.cols)
+
+        char_codes = np.full(self.cols, 32, dtype=np.uint32)
+        fg_rgb = np.full(self.cols, self.default_fg, dtype=np.uint32)
+        bg_rgb = np.full(self.cols, self.default_bg, dtype=np.uint32)
+        cell_attrs = np.zeros(self.cols, dtype=np.uint32)
+        char_codes[:n] = codes[:n]
+        fg_rgb[:n] = fg[:n]
+        bg_rgb[:n] = bg[:n]
+        cell_attrs[:n] = attrs[:n]
+
+        selected = np.zeros(self.cols, dtype=bool)
+        span = self._selected_span(abs_row)
+        if span is not None:
+            selected[span[0]:span[1] + 1] = True
+
+        # Reverse video (selection wins), then selection background
+        swap = ((cell_attrs & int(CellAttr.REVERSE)) != 0) & ~selected
+        fg_rgb, bg_rgb = np.where(swap, bg_rgb, fg_rgb), np.where(swap, fg_rgb, bg_rgb)
+        bg_rgb = np.where(selected, self.selection_bg, bg_rgb)
+        cell_attrs[selected] |= int(CellAttr.SELECTED)
+
+        out[:, 0] = char_codes
+        out[:, 1] = ((fg_rgb >> 16) & 0xFF) / 255.0
+        out[:, 2] = ((fg_rgb >> 8) & 0xFF) / 255.0
+        out[:, 3] = (fg_rgb & 0xFF) / 255.0
+        out[:, 4] = ((bg_rgb >> 16) & 0xFF) / 255.0
+        out[:, 5] = ((bg_rgb >> 8) & 0xFF) / 255.0
+        out[:, 6] = (bg_rgb & 0xFF) / 255.0
+        out[:, 7] = cell_attrs
+
     def to_render_array(self) -> np.ndarray:
         """
         Pack visible cells into numpy array for GPU.
@@ -471,6 +609,15 @@ class PyteTerminalBuffer:
             abs_row = self._scroll_offset + view_row
             line = self.get_line(abs_row)
 
+            # History rows are already packed - vectorized fill
+            if isinstance(line, tuple):
+                self._render_packed_row(data[view_row], line, abs_row)
+                continue
+
+            # Selection is resolved once per row, not per cell
+            span = self._selected_span(abs_row)
+            sel_start, sel_end = span if span is not None else (self.cols, -1)
+
             for col in range(self.cols):
                 if line is not None:
                     char = line.get(col, self.screen.default_char)
@@ -486,24 +633,12 @@ class PyteTerminalBuffer:
                 bg = pyte_color_to_rgb(char.bg, self.default_bg)
 
                 # Check selection
-                selected = self.is_selected(abs_row, col)
+                selected = sel_start <= col <= sel_end
                 if selected:
                     bg = self.selection_bg
 
                 # Build attributes
-                attrs = CellAttr.NONE
-                if char.bold:
-                    attrs |= CellAttr.BOLD
-                if char.italics:
-                    attrs |= CellAttr.ITALIC
-                if char.underscore:
-                    attrs |= CellAttr.UNDERLINE
-                if char.blink:
-                    attrs |= CellAttr.BLINK
-                if char.reverse:
-                    attrs |= CellAttr.REVERSE
-                if char.strikethrough:
-                    attrs |= CellAttr.STRIKE
+                attrs = char_attrs(char)
                 if selected:
                     attrs |= CellAttr.SELECTED
 
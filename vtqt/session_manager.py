@@ -6,17 +6,127 @@ stored in ~/.velocitermqt/sessions.yaml
 """
 
 import os
+import re
+from contextlib import ExitStack
 from typing import Optional, List
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import (
+    Qt, QModelIndex, QPersistentModelIndex, QTimer, QSignalBlocker, QThreadPool,
+    QCoreApplication, QEvent
+)
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QSpinBox, QComboBox, QPushButton,
-    QGroupBox, QMessageBox, QTreeWidget, QTreeWidgetItem,
+    QGroupBox, QMessageBox, QTreeView,
     QWidget, QSplitter, QInputDialog
 )
 
-from .config_manager import get_config, SessionInfo, SessionFolder, Credential
+from .config_manager import get_config, SessionInfo, Credential
+from .session_model import (
+    SessionTreeModel, SaveSessionsSignals, SaveSessionsTask,
+    folder_list_model, credential_list_model, folder_completer
+)
+from . import icons
+from .icons import emoji_icon
+
+
+# Anything paramiko may resolve (IDN names, IPv6 zone ids): just no whitespace
+_HOST_RE = re.compile(r"^\S{1,255}$")
+
+# Folder names are single-line tree labels
+_FOLDER_RE = re.compile(r"^[^\x00-\x1f\x7f]{1,128}$")
+
+# Device type suggestions for the Type combo
+DEVICE_TYPES = (
+    "linux", "cisco_ios", "cisco_nxos", "cisco_xe", "cisco_xr",
+    "arista_eos", "juniper_junos", "paloalto_panos", "fortinet",
+    "hp_procurve", "dell_os10", "mikrotik", "ubiquiti_edgeos",
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Stylesheets (parsed once at import, shared by every dialog instance)
+# ─────────────────────────────────────────────────────────────────────────────
+
+_SESSION_MANAGER_QSS = """
+    QDialog {
+        background-color: #2d2d2d;
+        color: #d4d4d4;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #404040;
+        border-radius: 4px;
+        margin-top: 8px;
+        padding-top: 8px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QLineEdit, QSpinBox, QComboBox {
+        background-color: #3c3c3c;
+        border: 1px solid #505050;
+        border-radius: 3px;
+        padding: 4px 8px;
+        color: #d4d4d4;
+    }
+    QLineEdit:focus, QSpinBox:focus, QComboBox:focus {
+        border-color: #0078d4;
+    }
+    QLineEdit:disabled, QSpinBox:disabled, QComboBox:disabled {
+        background-color: #2a2a2a;
+        color: #808080;
+    }
+    QTreeView {
+        background-color: #1e1e1e;
+        border: 1px solid #404040;
+        border-radius: 4px;
+    }
+    QTreeView::item {
+        padding: 4px;
+    }
+    QTreeView::item:selected {
+        background-color: #094771;
+    }
+    QPushButton {
+        background-color: #3c3c3c;
+        border: 1px solid #505050;
+        border-radius: 4px;
+        padding: 6px 12px;
+        color: #d4d4d4;
+    }
+    QPushButton:hover {
+        background-color: #4a4a4a;
+    }
+    QPushButton:disabled {
+        background-color: #2a2a2a;
+        color: #606060;
+    }
+"""
+
+_SESSION_EDITOR_QSS = """
+    QDialog { background-color: #2d2d2d; color: #d4d4d4; }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #404040;
+        border-radius: 4px;
+        margin-top: 8px;
+        padding-top: 8px;
+    }
+    QLineEdit, QSpinBox, QComboBox {
+        background-color: #3c3c3c;
+        border: 1px solid #505050;
+        padding: 4px;
+        color: #d4d4d4;
+    }
+    QPushButton {
+        background-color: #3c3c3c;
+        border: 1px solid #505050;
+        padding: 6px 12px;
+    }
+"""
 
 
 class SessionManagerDialog(QDialog):
@@ -24,6 +134,12 @@ class SessionManagerDialog(QDialog):
     Dialog for managing SSH sessions.
     """
 
+    # Coalesce edits made within this window into one sessions.yaml write
+    FLUSH_DELAY_MS = 500
+
+    # Editor follows the tree only after selection settles (arrow-key nav)
+    SELECT_DELAY_MS = 50
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Session Manager")
@@ -34,9 +150,30 @@ class SessionManagerDialog(QDialog):
         self._current_folder: Optional[str] = None
         self._is_new = False
 
+        # Debounced sessions.yaml writer
+        self._dirty = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self._flush_config)
+
+        # One writer thread; at most one save in flight, later edits coalesce
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._save_in_flight = False
+        self._save_signals = SaveSessionsSignals(self)
+        self._save_signals.finished.connect(self._on_save_done)
+
+        # Debounced tree selection -> editor
+        self._pending_index = QPersistentModelIndex()
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(self.SELECT_DELAY_MS)
+        self._select_timer.timeout.connect(self._apply_selection)
+
         self._setup_ui()
         self._apply_styling()
-        self._load_sessions()
+        self._reload_from_disk()
 
     def _setup_ui(self):
         """Build the dialog UI."""
@@ -52,23 +189,28 @@ class SessionManagerDialog(QDialog):
 
         tree_layout.addWidget(QLabel("Sessions:"))
 
-        self._session_tree = QTreeWidget()
+        self._session_model = SessionTreeModel(get_config(), self)
+        self._session_tree = QTreeView()
         self._session_tree.setHeaderHidden(True)
         self._session_tree.setRootIsDecorated(True)
-        self._session_tree.itemClicked.connect(self._on_selection_changed)
+        self._session_tree.setUniformRowHeights(True)
+        self._session_tree.setAnimated(False)
+        self._session_tree.setExpandsOnDoubleClick(False)
+        self._session_tree.setModel(self._session_model)
+        self._session_tree.selectionModel().currentChanged.connect(self._on_selection_changed)
         tree_layout.addWidget(self._session_tree)
 
         # Tree buttons
         tree_btn_layout = QHBoxLayout()
-        self._add_folder_btn = QPushButton("📁 Folder")
+        self._add_folder_btn = QPushButton(emoji_icon(icons.FOLDER), "Folder")
         self._add_folder_btn.clicked.connect(self._add_folder)
         tree_btn_layout.addWidget(self._add_folder_btn)
 
-        self._add_session_btn = QPushButton("➕ Session")
+        self._add_session_btn = QPushButton(emoji_icon(icons.ADD), "Session")
         self._add_session_btn.clicked.connect(self._add_session)
         tree_btn_layout.addWidget(self._add_session_btn)
 
-        self._delete_btn = QPushButton("🗑️ Delete")
+        self._delete_btn = QPushButton(emoji_icon(icons.DELETE), "Delete")
         self._delete_btn.clicked.connect(self._delete_selected)
         self._delete_btn.setEnabled(False)
         tree_btn_layout.addWidget(self._delete_btn)
@@ -107,6 +249,10 @@ class SessionManagerDialog(QDialog):
         conn_grid.addWidget(QLabel("Folder:"), row, 0)
         self._folder_combo = QComboBox()
         self._folder_combo.setEditable(True)
+        self._folder_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self._folder_model = folder_list_model()
+        self._folder_combo.setModel(self._folder_model)
+        self._folder_combo.setCompleter(folder_completer(self))
         conn_grid.addWidget(self._folder_combo, row, 1, 1, 4)
         row += 1
 
@@ -119,11 +265,7 @@ class SessionManagerDialog(QDialog):
         device_grid.addWidget(QLabel("Type:"), 0, 0)
         self._type_combo = QComboBox()
         self._type_combo.setEditable(True)
-        self._type_combo.addItems([
-            "linux", "cisco_ios", "cisco_nxos", "cisco_xe", "cisco_xr",
-            "arista_eos", "juniper_junos", "paloalto_panos", "fortinet",
-            "hp_procurve", "dell_os10", "mikrotik", "ubiquiti_edgeos"
-        ])
+        self._type_combo.addItems(DEVICE_TYPES)
         device_grid.addWidget(self._type_combo, 0, 1)
 
         device_grid.addWidget(QLabel("Vendor:"), 0, 2)
@@ -150,10 +292,11 @@ class SessionManagerDialog(QDialog):
 
         auth_grid.addWidget(QLabel("Credential:"), 0, 0)
         self._cred_combo = QComboBox()
+        self._cred_combo.setModel(credential_list_model())
         self._cred_combo.currentIndexChanged.connect(self._on_credential_changed)
         auth_grid.addWidget(self._cred_combo, 0, 1, 1, 2)
 
-        self._manage_creds_btn = QPushButton("🔑 Manage...")
+        self._manage_creds_btn = QPushButton(emoji_icon(icons.MANAGE), "Manage...")
         self._manage_creds_btn.clicked.connect(self._open_credential_manager)
         auth_grid.addWidget(self._manage_creds_btn, 0, 3)
 
@@ -169,12 +312,12 @@ class SessionManagerDialog(QDialog):
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
 
-        self._save_btn = QPushButton("💾 Save")
+        self._save_btn = QPushButton(emoji_icon(icons.SAVE), "Save")
         self._save_btn.clicked.connect(self._save_session)
         self._save_btn.setEnabled(False)
         btn_layout.addWidget(self._save_btn)
 
-        self._cancel_btn = QPushButton("↩ Cancel")
+        self._cancel_btn = QPushButton(emoji_icon(icons.CANCEL), "Cancel")
         self._cancel_btn.clicked.connect(self._cancel_edit)
         self._cancel_btn.setEnabled(False)
         btn_layout.addWidget(self._cancel_btn)
@@ -195,187 +338,254 @@ class SessionManagerDialog(QDialog):
         dialog_btn_layout.addWidget(close_btn)
         layout.addLayout(dialog_btn_layout)
 
+        # Editor inputs (filled/cleared together) and everything toggled with them
+        self._editor_inputs = (
+            self._name_edit, self._host_edit, self._port_spin, self._folder_combo,
+            self._type_combo, self._vendor_edit, self._model_edit, self._serial_edit,
+            self._version_edit, self._cred_combo, self._direct_username,
+        )
+        self._editor_widgets = self._editor_inputs + (self._save_btn, self._cancel_btn)
+
         # Initially disable editor
         self._set_editor_enabled(False)
 
     def _apply_styling(self):
         """Apply dark theme styling."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2d2d2d;
-                color: #d4d4d4;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLineEdit, QSpinBox, QComboBox {
-                background-color: #3c3c3c;
-                border: 1px solid #505050;
-                border-radius: 3px;
-                padding: 4px 8px;
-                color: #d4d4d4;
-            }
-            QLineEdit:focus, QSpinBox:focus, QComboBox:focus {
-                border-color: #0078d4;
-            }
-            QLineEdit:disabled, QSpinBox:disabled, QComboBox:disabled {
-                background-color: #2a2a2a;
-                color: #808080;
-            }
-            QTreeWidget {
-                background-color: #1e1e1e;
-                border: 1px solid #404040;
-                border-radius: 4px;
-            }
-            QTreeWidget::item {
-                padding: 4px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #094771;
-            }
-            QPushButton {
-                background-color: #3c3c3c;
-                border: 1px solid #505050;
-                border-radius: 4px;
-                padding: 6px 12px;
-                color: #d4d4d4;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-            }
-            QPushButton:disabled {
-                background-color: #2a2a2a;
-                color: #606060;
-            }
-        """)
-
-    def _load_sessions(self):
-        """Load sessions into tree."""
-        self._session_tree.clear()
-        self._folder_combo.clear()
-        self._cred_combo.clear()
+        self.setStyleSheet(_SESSION_MANAGER_QSS)
 
-        config = get_config()
-        config.load_sessions()
-        config.load_credentials()
+    def _mark_dirty(self):
+        """Schedule a sessions.yaml write (restarts the debounce)."""
+        self._dirty = True
+        self._flush_timer.start()
+
+    def _flush_config(self, wait: bool = False):
+        """
+        Write pending session changes to disk.
 
-        # Populate folder combo
-        folder_names = [f.folder_name for f in config.session_folders]
-        self._folder_combo.addItems(folder_names)
+        Normally the YAML dump runs on a background thread; with wait=True
+        any in-flight write is finished and the rest is saved synchronously.
+        """
+        self._flush_timer.stop()
+        config = get_config()
 
-        # Populate credential combo
-        self._cred_combo.addItem("(none)", "")
-        for cred in config.credentials:
-            auth_icon = {"password": "🔑", "key": "🔐", "agent": "🔓"}.get(cred.auth_method, "")
-            self._cred_combo.addItem(f"{auth_icon} {cred.name} ({cred.username})", cred.id)
+        if wait:
+            self._save_pool.waitForDone()
+            # Deliver the queued _on_save_done now so a failed write is dirty
+            # again (PyQt posts it to a slot proxy, not to self)
+            QCoreApplication.sendPostedEvents(None, QEvent.Type.MetaCall)
+            self._save_in_flight = False
+            if self._dirty:
+                if config.save_sessions():
+                    self._dirty = False
+                else:
+                    self._warn_save_failed("The changes apply to this session only.")
+            return
 
-        # Populate tree
-        for folder in config.session_folders:
-            folder_item = QTreeWidgetItem([f"📁 {folder.folder_name}"])
-            folder_item.setData(0, Qt.ItemDataRole.UserRole, ("folder", folder.folder_name))
-            folder_item.setExpanded(True)
+        if not self._dirty or self._save_in_flight:
+            return  # _on_save_done re-schedules if still dirty
+
+        self._dirty = False
+        self._save_in_flight = True
+        self._save_pool.start(SaveSessionsTask(config, config.sessions_data(), self._save_signals))
+
+    def _on_save_done(self, ok: bool):
+        """Background write finished; flush anything that landed meanwhile."""
+        self._save_in_flight = False
+        if not ok:
+            # Keep the edits pending; the next edit or done() retries
+            self._dirty = True
+            self._warn_save_failed(
+                "Your changes are kept and will be saved again on the next "
+                "edit or when this dialog closes."
+            )
+            return
+        if self._dirty:
+            self._flush_timer.start()
+
+    def _warn_save_failed(self, detail: str):
+        """Report a failed sessions.yaml write."""
+        QMessageBox.warning(
+            self, "Save Failed",
+            f"Could not write {get_config().sessions_file}.\n\n{detail}"
+        )
 
-            for session in folder.sessions:
-                session_text = session.display_name or session.host
-                session_item = QTreeWidgetItem([f"  🖥 {session_text}"])
-                session_item.setData(0, Qt.ItemDataRole.UserRole, ("session", session, folder.folder_name))
-                session_item.setToolTip(0, f"{session.host}:{session.port}")
-                folder_item.addChild(session_item)
+    def done(self, result: int):
+        """Flush pending writes on accept/reject/close."""
+        self._flush_config(wait=True)
+        super().done(result)
 
-            self._session_tree.addTopLevelItem(folder_item)
+    def _reload_from_disk(self):
+        """Re-read sessions/credentials and rebuild tree and combos."""
+        self._flush_config(wait=True)
 
-    def _on_selection_changed(self, item: QTreeWidgetItem, column: int):
-        """Handle tree selection."""
-        data = item.data(0, Qt.ItemDataRole.UserRole)
+        config = get_config()
+        config.load_sessions()
+        config.load_credentials()
 
-        if data is None:
+        # Bulk repopulate with painting and per-item signals suppressed
+        self._session_tree.setUpdatesEnabled(False)
+        self._session_tree.setSortingEnabled(False)
+        self._session_tree.selectionModel().blockSignals(True)
+        self._folder_combo.blockSignals(True)
+        self._cred_combo.blockSignals(True)
+        try:
+            # Refresh shared folder/credential combo models (no-op if unchanged)
+            folder_list_model(config)
+            credential_list_model(config)
+
+            # Populate tree - folders only, sessions load on expand
+            self._session_model.reset()
+
+            # Keep the folder of the session being edited open
+            if self._current_session is not None:
+                index = self._session_model.session_index(
+                    self._current_session.host, self._current_session.port_int
+                )
+                if index.isValid():
+                    self._session_tree.expand(index.parent())
+        finally:
+            self._cred_combo.blockSignals(False)
+            self._folder_combo.blockSignals(False)
+            self._session_tree.selectionModel().blockSignals(False)
+            self._session_tree.setUpdatesEnabled(True)
+
+        # Sync the direct-username field with the (reset) credential choice
+        self._sync_direct_username()
+
+    # ─────────────────────────────────────────────────────────────
+    # Incremental tree updates
+    # ─────────────────────────────────────────────────────────────
+
+    def _tree_add_folder(self, folder_name: str) -> QModelIndex:
+        """Add an empty folder row and combo entry."""
+        index = self._session_model.add_folder(folder_name)
+        row = self._folder_model.rowCount()
+        self._folder_model.insertRow(row)
+        self._folder_model.setData(self._folder_model.index(row), folder_name)
+        return index
+
+    def _tree_remove_folder(self, row: int):
+        """Remove a folder row and its combo entry."""
+        # Folder model rows mirror tree folder rows
+        self._session_model.remove_folder(row)
+        self._folder_model.removeRow(row)
+
+    def _tree_add_session(self, folder_name: str, session: SessionInfo) -> QModelIndex:
+        """Add a session row, creating its folder if needed."""
+        if self._session_model.folder_row(folder_name) < 0:
+            self._tree_add_folder(folder_name)
+        index = self._session_model.add_session(folder_name, session)
+        self._session_tree.setExpanded(index.parent(), True)
+        return index
+
+    def _tree_remove_session(self, index: QModelIndex):
+        """Remove a session row (and its folder if left empty)."""
+        folder = self._session_model.parent_folder(index)
+        if len(folder.sessions) == 1:
+            self._tree_remove_folder(index.parent().row())
+        else:
+            self._session_model.remove_session(index)
+
+    def _on_selection_changed(self, current: QModelIndex, previous: QModelIndex):
+        """Handle tree selection (coalesced; see _apply_selection)."""
+        self._pending_index = QPersistentModelIndex(current)
+        self._select_timer.start()
+
+    def _flush_selection(self):
+        """Apply a pending selection change now, if any."""
+        if self._select_timer.isActive():
+            self._apply_selection()
+
+    def _apply_selection(self):
+        """Load the settled tree selection into the editor."""
+        self._select_timer.stop()
+        current = QModelIndex(self._pending_index)
+
+        if not current.isValid():
             self._current_session = None
             self._current_folder = None
             self._set_editor_enabled(False)
             self._delete_btn.setEnabled(False)
             return
 
-        if data[0] == "folder":
+        folder = self._session_model.folder_at(current)
+        if folder is not None:
             self._current_session = None
-            self._current_folder = data[1]
+            self._current_folder = folder.folder_name
             self._clear_editor()
             self._set_editor_enabled(False)
             self._delete_btn.setEnabled(True)
+            return
 
-        elif data[0] == "session":
-            self._current_session = data[1]
-            self._current_folder = data[2]
-            self._is_new = False
-            self._populate_editor(data[1], data[2])
-            self._set_editor_enabled(True)
-            self._delete_btn.setEnabled(True)
+        session = self._session_model.session_at(current)
+        folder_name = self._session_model.parent_folder(current).folder_name
+        self._current_session = session
+        self._current_folder = folder_name
+        self._is_new = False
+        self._populate_editor(session, folder_name)
+        self._set_editor_enabled(True)
+        self._delete_btn.setEnabled(True)
+
+    def _block_editor_signals(self) -> ExitStack:
+        """Context manager silencing every editor input while it's filled."""
+        stack = ExitStack()
+        for widget in self._editor_inputs:
+            stack.enter_context(QSignalBlocker(widget))
+        return stack
+
+    def _sync_direct_username(self):
+        """Direct username is only editable when no credential is chosen."""
+        self._direct_username.setEnabled(
+            self._cred_combo.isEnabled() and self._cred_combo.currentIndex() <= 0
+        )
 
     def _populate_editor(self, session: SessionInfo, folder_name: str):
         """Populate editor from session."""
-        self._name_edit.setText(session.display_name)
-        self._host_edit.setText(session.host)
-        self._port_spin.setValue(session.get_port_int())
+        with self._block_editor_signals():
+            self._name_edit.setText(session.display_name)
+            self._host_edit.setText(session.host)
+            self._port_spin.setValue(session.port_int)
 
-        # Set folder
-        idx = self._folder_combo.findText(folder_name)
-        if idx >= 0:
-            self._folder_combo.setCurrentIndex(idx)
+            # Set folder
+            idx = self._folder_combo.findText(folder_name)
+            if idx >= 0:
+                self._folder_combo.setCurrentIndex(idx)
 
-        # Device info
-        self._type_combo.setCurrentText(session.DeviceType or "linux")
-        self._vendor_edit.setText(session.Vendor)
-        self._model_edit.setText(session.Model)
-        self._serial_edit.setText(session.SerialNumber)
-        self._version_edit.setText(session.SoftwareVersion)
+            # Device info
+            self._type_combo.setCurrentText(session.DeviceType or "linux")
+            self._vendor_edit.setText(session.Vendor)
+            self._model_edit.setText(session.Model)
+            self._serial_edit.setText(session.SerialNumber)
+            self._version_edit.setText(session.SoftwareVersion)
 
-        # Credential
-        cred_idx = 0
-        if session.credsid:
-            for i in range(self._cred_combo.count()):
-                if self._cred_combo.itemData(i) == session.credsid:
-                    cred_idx = i
-                    break
-        self._cred_combo.setCurrentIndex(cred_idx)
+            # Credential
+            self._cred_combo.setCurrentIndex(credential_list_model().row_for(session.credsid))
+
+            self._direct_username.setText(session.username)
 
-        self._direct_username.setText(session.username)
+        self._sync_direct_username()
 
     def _clear_editor(self):
         """Clear editor fields."""
-        self._name_edit.clear()
-        self._host_edit.clear()
-        self._port_spin.setValue(22)
-        self._type_combo.setCurrentText("linux")
-        self._vendor_edit.clear()
-        self._model_edit.clear()
-        self._serial_edit.clear()
-        self._version_edit.clear()
-        self._cred_combo.setCurrentIndex(0)
-        self._direct_username.clear()
+        with self._block_editor_signals():
+            self._name_edit.clear()
+            self._host_edit.clear()
+            self._port_spin.setValue(22)
+            self._type_combo.setCurrentText("linux")
+            self._vendor_edit.clear()
+            self._model_edit.clear()
+            self._serial_edit.clear()
+            self._version_edit.clear()
+            self._cred_combo.setCurrentIndex(0)
+            self._direct_username.clear()
+
+        self._sync_direct_username()
 
     def _set_editor_enabled(self, enabled: bool):
         """Enable/disable editor."""
-        self._name_edit.setEnabled(enabled)
-        self._host_edit.setEnabled(enabled)
-        self._port_spin.setEnabled(enabled)
-        self._folder_combo.setEnabled(enabled)
-        self._type_combo.setEnabled(enabled)
-        self._vendor_edit.setEnabled(enabled)
-        self._model_edit.setEnabled(enabled)
-        self._serial_edit.setEnabled(enabled)
-        self._version_edit.setEnabled(enabled)
-        self._cred_combo.setEnabled(enabled)
-        self._direct_username.setEnabled(enabled)
-        self._save_btn.setEnabled(enabled)
-        self._cancel_btn.setEnabled(enabled)
+        for widget in self._editor_widgets:
+            widget.setEnabled(enabled)
+        self._sync_direct_username()
 
     def _on_credential_changed(self, index: int):
         """Handle credential selection change."""
@@ -388,21 +598,25 @@ class SessionManagerDialog(QDialog):
     def _add_folder(self):
         """Add a new folder."""
         name, ok = QInputDialog.getText(self, "New Folder", "Folder name:")
+        name = name.strip()
         if ok and name:
-            config = get_config()
+            if not _FOLDER_RE.match(name):
+                QMessageBox.warning(self, "Error", f"Invalid folder name '{name}'.")
+                return
+
             # Check for duplicate
-            for folder in config.session_folders:
-                if folder.folder_name == name:
-                    QMessageBox.warning(self, "Error", f"Folder '{name}' already exists.")
-                    return
+            if self._session_model.folder_row(name) >= 0:
+                QMessageBox.warning(self, "Error", f"Folder '{name}' already exists.")
+                return
 
-            config.session_folders.append(SessionFolder(folder_name=name))
-            config.save_sessions()
-            self._load_sessions()
+            self._tree_add_folder(name)
+            self._mark_dirty()
 
     def _add_session(self):
         """Add a new session."""
         self._session_tree.clearSelection()
+        self._session_tree.setCurrentIndex(QModelIndex())
+        self._flush_selection()
         self._clear_editor()
         self._is_new = True
         self._current_session = None
@@ -416,53 +630,61 @@ class SessionManagerDialog(QDialog):
 
     def _delete_selected(self):
         """Delete selected item."""
+        self._flush_selection()
         if self._current_session:
             result = QMessageBox.question(
                 self, "Delete Session",
-                f"Delete session '{self._current_session.display_name or self._current_session.host}'?",
+                f"Delete session '{self._current_session.label}'?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             if result == QMessageBox.StandardButton.Yes:
-                config = get_config()
-                config.remove_session(self._current_session.host, self._current_session.get_port_int())
-                config.save_sessions()
-                self._load_sessions()
+                self._tree_remove_session(self._session_tree.currentIndex())
+                self._mark_dirty()
                 self._clear_editor()
                 self._set_editor_enabled(False)
 
         elif self._current_folder:
-            config = get_config()
+            row = self._session_model.folder_row(self._current_folder)
+            if row < 0:
+                return
+
             # Check if folder has sessions
-            for folder in config.session_folders:
-                if folder.folder_name == self._current_folder:
-                    if folder.sessions:
-                        result = QMessageBox.question(
-                            self, "Delete Folder",
-                            f"Folder '{self._current_folder}' contains {len(folder.sessions)} sessions.\n"
-                            "Delete folder and all sessions?",
-                            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                        )
-                        if result != QMessageBox.StandardButton.Yes:
-                            return
-                    break
-
-            config.session_folders = [f for f in config.session_folders if f.folder_name != self._current_folder]
-            config.save_sessions()
-            self._load_sessions()
+            folder = self._session_model.folders[row]
+            if folder.sessions:
+                result = QMessageBox.question(
+                    self, "Delete Folder",
+                    f"Folder '{self._current_folder}' contains {len(folder.sessions)} sessions.\n"
+                    "Delete folder and all sessions?",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                )
+                if result != QMessageBox.StandardButton.Yes:
+                    return
+
+            self._tree_remove_folder(row)
+            self._mark_dirty()
 
     def _save_session(self):
         """Save current session."""
+        self._flush_selection()
         host = self._host_edit.text().strip()
         if not host:
             QMessageBox.warning(self, "Error", "Host is required.")
             self._host_edit.setFocus()
             return
+        if not _HOST_RE.match(host):
+            QMessageBox.warning(self, "Error", f"Invalid host '{host}'.")
+            self._host_edit.setFocus()
+            return
 
         folder_name = self._folder_combo.currentText().strip()
         if not folder_name:
             QMessageBox.warning(self, "Error", "Folder is required.")
             self._folder_combo.setFocus()
             return
+        if not _FOLDER_RE.match(folder_name):
+            QMessageBox.warning(self, "Error", f"Invalid folder name '{folder_name}'.")
+            self._folder_combo.setFocus()
+            return
 
         session = SessionInfo(
             display_name=self._name_edit.text().strip(),
@@ -477,37 +699,30 @@ class SessionManagerDialog(QDialog):
             username=self._direct_username.text().strip(),
         )
 
-        config = get_config()
+        index = self._session_tree.currentIndex()
+        editing = not self._is_new and self._current_session is not None
 
-        # Remove old session if editing
-        if not self._is_new and self._current_session:
-            config.remove_session(self._current_session.host, self._current_session.get_port_int())
+        if editing and folder_name == self._current_folder:
+            # Same folder - update the row in place
+            self._session_model.replace_session(index, session)
+        else:
+            # Moved or new - remove old row if editing, append to folder
+            if editing:
+                self._tree_remove_session(index)
+            index = self._tree_add_session(folder_name, session)
 
-        # Add to folder
-        config.add_session(folder_name, session)
-        config.save_sessions()
+        self._mark_dirty()
 
-        self._load_sessions()
         self._is_new = False
+        self._current_session = session
+        self._current_folder = folder_name
 
         # Re-select the saved session
-        self._select_session(host, session.get_port_int())
-
-    def _select_session(self, host: str, port: int):
-        """Select a session in the tree by host/port."""
-        for i in range(self._session_tree.topLevelItemCount()):
-            folder_item = self._session_tree.topLevelItem(i)
-            for j in range(folder_item.childCount()):
-                session_item = folder_item.child(j)
-                data = session_item.data(0, Qt.ItemDataRole.UserRole)
-                if data and data[0] == "session":
-                    session = data[1]
-                    if session.host == host and session.get_port_int() == port:
-                        self._session_tree.setCurrentItem(session_item)
-                        return
+        self._session_tree.setCurrentIndex(index)
 
     def _cancel_edit(self):
         """Cancel current edit."""
+        self._flush_selection()
         if self._is_new:
             self._clear_editor()
             self._set_editor_enabled(False)
@@ -520,8 +735,20 @@ class SessionManagerDialog(QDialog):
         from .credential_manager import CredentialManagerDialog
         dialog = CredentialManagerDialog(self)
         dialog.exec()
-        # Refresh credential combo
-        self._load_sessions()
+        # Refresh credential combo (sessions are untouched by this dialog)
+        if dialog.credentials_changed:
+            self._refresh_credentials_only()
+
+    def _refresh_credentials_only(self):
+        """Rebuild the credential combo, keeping the current choice."""
+        cred_id = self._cred_combo.currentData() or ""
+
+        self._cred_combo.blockSignals(True)
+        model = credential_list_model()
+        self._cred_combo.setCurrentIndex(model.row_for(cred_id))
+        self._cred_combo.blockSignals(False)
+
+        self._sync_direct_username()
 
 
 class SessionEditorDialog(QDialog):
@@ -572,6 +799,7 @@ class SessionEditorDialog(QDialog):
         conn_grid.addWidget(QLabel("Folder:"), 2, 0)
         self._folder_combo = QComboBox()
         self._folder_combo.setEditable(True)
+        self._folder_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         conn_grid.addWidget(self._folder_combo, 2, 1, 1, 3)
 
         layout.addWidget(conn_group)
@@ -598,7 +826,7 @@ class SessionEditorDialog(QDialog):
         device_grid.addWidget(QLabel("Type:"), 0, 0)
         self._type_combo = QComboBox()
         self._type_combo.setEditable(True)
-        self._type_combo.addItems(["linux", "cisco_ios", "cisco_nxos", "arista_eos", "juniper_junos"])
+        self._type_combo.addItems(DEVICE_TYPES)
         device_grid.addWidget(self._type_combo, 0, 1)
 
         device_grid.addWidget(QLabel("Vendor:"), 1, 0)
@@ -625,56 +853,27 @@ class SessionEditorDialog(QDialog):
 
     def _apply_styling(self):
         """Apply styling."""
-        self.setStyleSheet("""
-            QDialog { background-color: #2d2d2d; color: #d4d4d4; }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-            }
-            QLineEdit, QSpinBox, QComboBox {
-                background-color: #3c3c3c;
-                border: 1px solid #505050;
-                padding: 4px;
-                color: #d4d4d4;
-            }
-            QPushButton {
-                background-color: #3c3c3c;
-                border: 1px solid #505050;
-                padding: 6px 12px;
-            }
-        """)
+        self.setStyleSheet(_SESSION_EDITOR_QSS)
 
     def _load_combos(self):
         """Load combo box data."""
         config = get_config()
-
-        # Folders
-        for folder in config.session_folders:
-            self._folder_combo.addItem(folder.folder_name)
-
-        # Credentials
-        self._cred_combo.addItem("(none)", "")
-        for cred in config.credentials:
-            self._cred_combo.addItem(f"{cred.name} ({cred.username})", cred.id)
+        self._folder_combo.setModel(folder_list_model(config))
+        self._folder_combo.setCompleter(folder_completer(self))
+        self._cred_combo.setModel(credential_list_model(config))
 
     def _populate_from_session(self, session: SessionInfo, folder_name: str):
         """Fill fields from session."""
         self._name_edit.setText(session.display_name)
         self._host_edit.setText(session.host)
-        self._port_spin.setValue(session.get_port_int())
+        self._port_spin.setValue(session.port_int)
 
         idx = self._folder_combo.findText(folder_name or "")
         if idx >= 0:
             self._folder_combo.setCurrentIndex(idx)
 
         # Credential
-        for i in range(self._cred_combo.count()):
-            if self._cred_combo.itemData(i) == session.credsid:
-                self._cred_combo.setCurrentIndex(i)
-                break
+        self._cred_combo.setCurrentIndex(credential_list_model().row_for(session.credsid))
 
         self._username_edit.setText(session.username)
         self._type_combo.setCurrentText(session.DeviceType or "linux")
@@ -687,11 +886,17 @@ class SessionEditorDialog(QDialog):
         if not host:
             QMessageBox.warning(self, "Error", "Host is required.")
             return
+        if not _HOST_RE.match(host):
+            QMessageBox.warning(self, "Error", f"Invalid host '{host}'.")
+            return
 
         folder_name = self._folder_combo.currentText().strip()
         if not folder_name:
             QMessageBox.warning(self, "Error", "Folder is required.")
             return
+        if not _FOLDER_RE.match(folder_name):
+            QMessageBox.warning(self, "Error", f"Invalid folder name '{folder_name}'.")
+            return
 
         session = SessionInfo(
             display_name=self._name_edit.text().strip(),
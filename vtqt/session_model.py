@@ -0,0 +1,366 @@
+"""
+Session Tree Model - Qt item model over the configured session folders.
+
+Backs the session trees in SessionManagerDialog and SSHConnectionDialog
+directly with ConfigManager.session_folders, so refreshing the tree is a
+model reset rather than rebuilding one QTreeWidgetItem per row.
+
+Index layout:
+  - Top-level rows are folders (internalPointer is None)
+  - Child rows are sessions (internalPointer is the parent SessionFolder)
+
+Session rows are fetched lazily: a folder reports no children to the
+view until it is first expanded (canFetchMore/fetchMore).
+
+internalPointer does not own the folder, so the model keeps every folder
+it has handed out alive until the next reset. Dialogs that edit the
+config behind the model's back (SessionManagerDialog, SessionEditorDialog)
+run inside suspended() so no view paints from stale indexes meanwhile.
+
+Also provides the folder/credential combo models shared by the session
+dialogs (folder_list_model / credential_list_model), and the background
+sessions.yaml writer they both use (SaveSessionsTask).
+"""
+
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Set
+
+from PyQt6.QtCore import (
+    Qt, QAbstractItemModel, QModelIndex, QStringListModel,
+    QObject, QRunnable, pyqtSignal
+)
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
+from PyQt6.QtWidgets import QCompleter
+
+from .config_manager import ConfigManager, SessionFolder, SessionInfo, get_config
+from .icons import emoji_icon, FOLDER, SESSION, AUTH_ICONS
+
+
+class SessionTreeModel(QAbstractItemModel):
+    """
+    Two-level folder/session model reading straight from a ConfigManager.
+
+    The model never copies session data; call reset() after the config's
+    folder list has been replaced or reloaded from disk, and use the
+    mutators below for single edits so the view updates only the rows
+    that changed.
+    """
+
+    def __init__(self, config: ConfigManager, parent=None):
+        super().__init__(parent)
+        self._config = config
+        self._folder_rows: Dict[int, int] = {}
+        self._folder_names: Dict[str, int] = {}
+        self._fetched: Set[int] = set()  # id() of folders whose rows are exposed
+        self._pinned: List[SessionFolder] = list(self.folders)  # internalPointer targets
+        self._rebuild_rows()
+
+    @property
+    def folders(self) -> List[SessionFolder]:
+        """Live folder list from config."""
+        return self._config.session_folders
+
+    def _rebuild_rows(self):
+        """Map folder identity/name -> row for O(1) lookups."""
+        self._folder_rows = {id(f): i for i, f in enumerate(self.folders)}
+        self._folder_names = {f.folder_name: i for i, f in enumerate(self.folders)}
+
+    def reset(self):
+        """Re-read the whole folder list from config."""
+        self.beginResetModel()
+        self._end_reset()
+
+    def _end_reset(self):
+        self._fetched.clear()
+        self._rebuild_rows()
+        self._pinned = list(self.folders)
+        self.endResetModel()
+
+    @contextmanager
+    def suspended(self):
+        """
+        Hold the model in reset while the config is edited elsewhere.
+
+        Views drop their indexes up front and re-read the folder list on
+        exit, so nothing dereferences a folder another dialog removed.
+        """
+        self.beginResetModel()
+        try:
+            yield
+        finally:
+            self._end_reset()
+
+    # ─────────────────────────────────────────────────────────────
+    # QAbstractItemModel interface
+    # ─────────────────────────────────────────────────────────────
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, None)
+        return self.createIndex(row, column, self.folders[parent.row()])
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        folder = index.internalPointer()
+        if folder is None:
+            return QModelIndex()
+        return self.createIndex(self._folder_rows[id(folder)], 0, None)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self.folders)
+        if parent.internalPointer() is None:
+            folder = self.folders[parent.row()]
+            return len(folder.sessions) if id(folder) in self._fetched else 0
+        return 0
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return bool(self.folders)
+        if parent.internalPointer() is None:
+            return bool(self.folders[parent.row()].sessions)
+        return False
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        folder = self.folder_at(parent)
+        return folder is not None and id(folder) not in self._fetched
+
+    def fetchMore(self, parent: QModelIndex):
+        folder = self.folder_at(parent)
+        if folder is None or id(folder) in self._fetched:
+            return
+        if folder.sessions:
+            self.beginInsertRows(parent, 0, len(folder.sessions) - 1)
+            self._fetched.add(id(folder))
+            self.endInsertRows()
+        else:
+            self._fetched.add(id(folder))
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        folder = self.folder_at(index)
+        if folder is not None:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return folder.folder_name
+            if role == Qt.ItemDataRole.DecorationRole:
+                return emoji_icon(FOLDER)
+            return None
+
+        session = self.session_at(index)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return session.label
+        if role == Qt.ItemDataRole.DecorationRole:
+            return emoji_icon(SESSION)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return session.tooltip
+        return None
+
+    # ─────────────────────────────────────────────────────────────
+    # Lookup helpers
+    # ─────────────────────────────────────────────────────────────
+
+    def folder_at(self, index: QModelIndex) -> Optional[SessionFolder]:
+        """Folder for a top-level index, else None."""
+        if not index.isValid() or index.internalPointer() is not None:
+            return None
+        return self.folders[index.row()]
+
+    def session_at(self, index: QModelIndex) -> Optional[SessionInfo]:
+        """Session for a child index, else None."""
+        if not index.isValid():
+            return None
+        folder = index.internalPointer()
+        if folder is None:
+            return None
+        return folder.sessions[index.row()]
+
+    def parent_folder(self, index: QModelIndex) -> Optional[SessionFolder]:
+        """Folder containing a session index, else None."""
+        if not index.isValid():
+            return None
+        return index.internalPointer()
+
+    def session_index(self, host: str, port: int) -> QModelIndex:
+        """Find the index of a session by host/port."""
+        location = self._config.locate_session(host, port)
+        if location is None:
+            return QModelIndex()
+        folder, session = location
+        folder_index = self.index(self._folder_rows[id(folder)], 0)
+        self.fetchMore(folder_index)
+        return self.index(folder.sessions.index(session), 0, folder_index)
+
+    def folder_row(self, folder_name: str) -> int:
+        """Row of a folder by name, or -1."""
+        return self._folder_names.get(folder_name, -1)
+
+    # ─────────────────────────────────────────────────────────────
+    # Mutators (update config and notify views)
+    # ─────────────────────────────────────────────────────────────
+
+    def add_folder(self, folder_name: str) -> QModelIndex:
+        """Append an empty folder and return its index."""
+        row = len(self.folders)
+        self.beginInsertRows(QModelIndex(), row, row)
+        folder = SessionFolder(folder_name=folder_name)
+        self.folders.append(folder)
+        self._pinned.append(folder)
+        self._folder_rows[id(folder)] = row
+        self._folder_names[folder_name] = row
+        self._fetched.add(id(folder))
+        self._config.mark_sessions_changed()
+        self.endInsertRows()
+        return self.index(row, 0)
+
+    def remove_folder(self, row: int):
+        """Remove a folder and all of its sessions."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._fetched.discard(id(self.folders[row]))
+        del self.folders[row]
+        self._rebuild_rows()
+        self._config.mark_sessions_changed()
+        self.endRemoveRows()
+
+    def add_session(self, folder_name: str, session: SessionInfo) -> QModelIndex:
+        """Append a session to a folder (creating it if needed)."""
+        row = self.folder_row(folder_name)
+        folder_index = self.add_folder(folder_name) if row < 0 else self.index(row, 0)
+        folder = self.folders[folder_index.row()]
+        self.fetchMore(folder_index)
+
+        child_row = len(folder.sessions)
+        self.beginInsertRows(folder_index, child_row, child_row)
+        folder.sessions.append(session)
+        self._config.mark_sessions_changed()
+        self.endInsertRows()
+        return self.index(child_row, 0, folder_index)
+
+    def replace_session(self, index: QModelIndex, session: SessionInfo):
+        """Swap the session at index in place."""
+        folder = self.parent_folder(index)
+        folder.sessions[index.row()] = session
+        self._config.mark_sessions_changed()
+        self.dataChanged.emit(index, index)
+
+    def remove_session(self, index: QModelIndex):
+        """Remove a session; drops its folder too if left empty."""
+        folder_index = index.parent()
+        folder = self.parent_folder(index)
+
+        self.beginRemoveRows(folder_index, index.row(), index.row())
+        del folder.sessions[index.row()]
+        self._config.mark_sessions_changed()
+        self.endRemoveRows()
+
+        if not folder.sessions:
+            self.remove_folder(folder_index.row())
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Background sessions.yaml writer
+# ─────────────────────────────────────────────────────────────────────────────
+
+class SaveSessionsSignals(QObject):
+    """Signals for SaveSessionsTask (QRunnable can't emit)."""
+    finished = pyqtSignal(bool)
+
+
+class SaveSessionsTask(QRunnable):
+    """
+    Writes a ConfigManager.sessions_data() snapshot on a pool thread.
+
+    Take the snapshot on the GUI thread and run the task on a
+    single-thread QThreadPool so writes land in order.
+    """
+
+    def __init__(self, config: ConfigManager, data: list, signals: SaveSessionsSignals):
+        super().__init__()
+        self._config = config
+        self._data = data
+        self._signals = signals
+
+    def run(self):
+        self._signals.finished.emit(self._config.write_sessions_data(self._data))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Shared combo models
+# ─────────────────────────────────────────────────────────────────────────────
+
+class CredentialListModel(QStandardItemModel):
+    """
+    Credential combo model: "(none)" at row 0, then one row per credential
+    with the credential id as UserRole data.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._id_rows: Dict[str, int] = {}
+
+    def refresh(self, config: ConfigManager):
+        """Rebuild rows from config.credentials."""
+        none_item = QStandardItem("(none)")
+        none_item.setData("", Qt.ItemDataRole.UserRole)
+        rows = [none_item]
+        self._id_rows = {}
+        for cred in config.credentials:
+            item = QStandardItem(f"{cred.name} ({cred.username})")
+            glyph = AUTH_ICONS.get(cred.auth_method)
+            if glyph:
+                item.setIcon(emoji_icon(glyph))
+            item.setData(cred.id, Qt.ItemDataRole.UserRole)
+            self._id_rows.setdefault(cred.id, len(rows))
+            rows.append(item)
+
+        self.clear()
+        self.invisibleRootItem().appendRows(rows)
+
+    def row_for(self, cred_id: str) -> int:
+        """Combo row for a credential id ((none) row if unknown)."""
+        return self._id_rows.get(cred_id, 0)
+
+
+_folder_model: Optional[QStringListModel] = None
+_folder_model_version = -1
+_credential_model: Optional[CredentialListModel] = None
+_credential_model_version = -1
+
+
+def folder_list_model(config: ConfigManager = None) -> QStringListModel:
+    """Shared folder-name model, refreshed when sessions change."""
+    global _folder_model, _folder_model_version
+    config = config or get_config()
+    if _folder_model is None:
+        _folder_model = QStringListModel()
+    if _folder_model_version != config.sessions_version:
+        _folder_model.setStringList([f.folder_name for f in config.session_folders])
+        _folder_model_version = config.sessions_version
+    return _folder_model
+
+
+def credential_list_model(config: ConfigManager = None) -> CredentialListModel:
+    """Shared credential model, refreshed when credentials change."""
+    global _credential_model, _credential_model_version
+    config = config or get_config()
+    if _credential_model is None:
+        _credential_model = CredentialListModel()
+    if _credential_model_version != config.credentials_version:
+        _credential_model.refresh(config)
+        _credential_model_version = config.credentials_version
+    return _credential_model
+
+
+def folder_completer(parent=None) -> QCompleter:
+    """Case-insensitive substring completer over the shared folder model."""
+    completer = QCompleter(folder_list_model(), parent)
+    completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+    completer.setFilterMode(Qt.MatchFlag.MatchContains)
+    return completer
@@ -10,23 +10,169 @@ Supports:
 """
 
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Set
 from dataclasses import dataclass, field
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QModelIndex, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QSpinBox, QComboBox, QPushButton,
     QCheckBox, QFileDialog, QGroupBox, QMessageBox,
-    QTabWidget, QWidget, QTreeWidget,
-    QTreeWidgetItem, QStackedWidget, QSplitter, QMenu
+    QTabWidget, QWidget, QTreeView,
+    QStackedWidget, QSplitter, QMenu
 )
-from PyQt6.QtGui import QAction
+from PyQt6.QtGui import QAction, QColor, QPalette
 
-from .config_manager import get_config, SessionInfo, Credential
+from .config_manager import get_config, SessionInfo, Credential, DEFAULT_USER
+from .icons import AUTH_ICONS
+from .session_model import SessionTreeModel, SaveSessionsSignals, SaveSessionsTask
 
 
-@dataclass
+# Process-lifetime constants (resolved once instead of per call)
+_HOME_DIR = os.path.expanduser("~")
+_DEFAULT_SSH_DIR = os.path.join(_HOME_DIR, ".ssh")
+
+# Auth method per combo row (Manual tab combo; override combo is offset by 1)
+_AUTH_METHODS = ("password", "key", "agent")
+
+
+# Key files already seen on disk. Misses are not cached, so a key created
+# after the first check (ssh-keygen) is found the next time round.
+_found_key_files: Set[str] = set()
+
+
+def _key_file_exists(key_file: str) -> bool:
+    """Whether a (~-relative) key file exists; cleared on browse/refresh."""
+    if key_file in _found_key_files:
+        return True
+    if os.path.isfile(os.path.expanduser(key_file)):
+        _found_key_files.add(key_file)
+        return True
+    return False
+
+
+@lru_cache(maxsize=128)
+def _key_basename(key_file: str) -> str:
+    """File name of a (~-relative) key path, for summaries."""
+    return os.path.basename(os.path.expanduser(key_file)) if key_file else ""
+
+
+# Auth method -> "Connection Will Use" summary line
+_AUTH_SUMMARY_FORMATTERS = {
+    "password": lambda auth: "Password: ●●●●●●●●" if auth.password else "Password: (will prompt)",
+    "key": lambda auth: f"Key: {_key_basename(auth.key_file)}" if auth.key_file else "Key: (default ~/.ssh/id_*)",
+    "agent": lambda auth: "SSH Agent + default keys",
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Stylesheet (parsed once at import, shared by every dialog instance)
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Plain window/text colors go through the palette; QSS keeps the rest
+_SSH_DIALOG_COLORS = {
+    QPalette.ColorRole.Window: "#2d2d2d",
+    QPalette.ColorRole.WindowText: "#d4d4d4",
+}
+
+_SSH_DIALOG_QSS = """
+    QTabWidget::pane {
+        border: 1px solid #404040;
+        background-color: #2d2d2d;
+    }
+    QTabBar::tab {
+        background-color: #3c3c3c;
+        color: #d4d4d4;
+        padding: 8px 16px;
+        border: 1px solid #404040;
+        border-bottom: none;
+    }
+    QTabBar::tab:selected {
+        background-color: #2d2d2d;
+        border-bottom: 1px solid #2d2d2d;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #404040;
+        border-radius: 4px;
+        margin-top: 8px;
+        padding-top: 8px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QLineEdit, QSpinBox, QComboBox {
+        background-color: #3c3c3c;
+        border: 1px solid #505050;
+        border-radius: 3px;
+        padding: 4px 8px;
+        color: #d4d4d4;
+    }
+    QLineEdit:focus, QSpinBox:focus, QComboBox:focus {
+        border-color: #0078d4;
+    }
+    QLineEdit:disabled {
+        background-color: #2a2a2a;
+        color: #808080;
+    }
+    QTreeView {
+        background-color: #1e1e1e;
+        border: 1px solid #404040;
+        border-radius: 4px;
+    }
+    QTreeView::item {
+        padding: 4px;
+    }
+    QTreeView::item:selected {
+        background-color: #094771;
+    }
+    QTreeView::item:hover {
+        background-color: #2a2d2e;
+    }
+    QPushButton {
+        background-color: #3c3c3c;
+        border: 1px solid #505050;
+        border-radius: 4px;
+        padding: 6px 16px;
+        color: #d4d4d4;
+    }
+    QPushButton:hover {
+        background-color: #4a4a4a;
+    }
+    QPushButton:pressed {
+        background-color: #2d2d2d;
+    }
+    QPushButton#connectButton {
+        background-color: #2d5a2d;
+        border-color: #3d7a3d;
+    }
+    QPushButton#connectButton:hover {
+        background-color: #3d7a3d;
+    }
+    QPushButton#cancelButton {
+        background-color: #5a2d2d;
+        border-color: #7a3d3d;
+    }
+    QPushButton#cancelButton:hover {
+        background-color: #7a3d3d;
+    }
+    QLabel#authSummary {
+        color: #4ec9b0;
+        font-family: monospace;
+        padding: 4px;
+        background-color: #1e1e1e;
+        border-radius: 3px;
+    }
+    QLabel#authWarning {
+        color: #cca700;
+    }
+"""
+
+
+@dataclass(slots=True)
 class SSHConnectionInfo:
     """SSH connection parameters for connecting."""
     host: str
@@ -57,13 +203,13 @@ class SSHConnectionInfo:
             else:
                 return "Password: (will prompt)"
         elif self.auth_method == "key":
-            key_name = os.path.basename(self.key_file) if self.key_file else "(default keys)"
+            key_name = _key_basename(self.key_file) or "(default keys)"
             return f"Key: {key_name}"
         else:
             return "SSH Agent"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedAuth:
     """Resolved authentication from session + credential + override."""
     username: str = ""
@@ -73,26 +219,50 @@ class ResolvedAuth:
     key_passphrase: str = ""
     source: str = ""  # Where the auth came from
 
-    def get_warnings(self) -> list[str]:
-        """Get non-blocking warnings about the auth config."""
+    def get_warnings(self, check_files: bool = True) -> list[str]:
+        """
+        Get non-blocking warnings about the auth config.
+
+        check_files=False skips the key file stat so the caller can run
+        it off the UI thread (see _KeyFileCheckTask).
+        """
         warnings = []
 
         if not self.username:
             warnings.append("No username - will use current user")
 
-        if self.auth_method == "key" and self.key_file:
-            expanded = os.path.expanduser(self.key_file)
-            if not os.path.isfile(expanded):
+        if check_files and self.auth_method == "key" and self.key_file:
+            if not _key_file_exists(self.key_file):
                 warnings.append(f"Key file not found: {self.key_file}")
 
         return warnings
 
 
+class _KeyFileCheckSignals(QObject):
+    """Signals for _KeyFileCheckTask (QRunnable can't emit)."""
+    finished = pyqtSignal(str, bool)
+
+
+class _KeyFileCheckTask(QRunnable):
+    """Stats a key file on a pool thread (home may be on NFS/SMB)."""
+
+    def __init__(self, key_file: str, signals: _KeyFileCheckSignals):
+        super().__init__()
+        self._key_file = key_file
+        self._signals = signals
+
+    def run(self):
+        self._signals.finished.emit(self._key_file, _key_file_exists(self._key_file))
+
+
 class SSHConnectionDialog(QDialog):
     """
     Dialog for SSH connections with session manager integration.
     """
 
+    # Override fields refresh the auth summary once typing pauses
+    SUMMARY_DELAY_MS = 75
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("SSH Connection")
@@ -102,6 +272,25 @@ class SSHConnectionDialog(QDialog):
         self._connection_info: Optional[SSHConnectionInfo] = None
         self._selected_session: Optional[SessionInfo] = None
         self._resolved_auth: Optional[ResolvedAuth] = None
+        self._key_file_dialog: Optional[QFileDialog] = None  # Shared by both Browse buttons
+        self._sessions_version = -1  # config.sessions_version the tree shows
+
+        # Key file existence is checked off the UI thread
+        self._auth_warnings: list[str] = []
+        self._key_check_pool = QThreadPool(self)
+        self._key_check_pool.setMaxThreadCount(1)
+        self._key_check_signals = _KeyFileCheckSignals(self)
+        self._key_check_signals.finished.connect(self._on_key_file_checked)
+
+        # sessions.yaml writes from the context menu run on one save thread
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._save_signals = None  # Created with the first save
+
+        self._summary_timer = QTimer(self)
+        self._summary_timer.setSingleShot(True)
+        self._summary_timer.setInterval(self.SUMMARY_DELAY_MS)
+        self._summary_timer.timeout.connect(self._update_auth_summary)
 
         self._setup_ui()
         self._apply_styling()
@@ -115,7 +304,12 @@ class SSHConnectionDialog(QDialog):
         # Main tab widget
         self.tabs = QTabWidget()
         self.tabs.addTab(self._create_sessions_tab(), "Sessions")
-        self.tabs.addTab(self._create_manual_tab(), "Manual")
+        # Manual tab contents are built the first time the tab is shown
+        self._manual_tab = QWidget()
+        QVBoxLayout(self._manual_tab).setContentsMargins(0, 0, 0, 0)
+        self._manual_tab_built = False
+        self.tabs.addTab(self._manual_tab, "Manual")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         layout.addWidget(self.tabs)
 
         # Button box with custom styling
@@ -149,104 +343,11 @@ class SSHConnectionDialog(QDialog):
 
     def _apply_styling(self):
         """Apply dark theme styling."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2d2d2d;
-                color: #d4d4d4;
-            }
-            QTabWidget::pane {
-                border: 1px solid #404040;
-                background-color: #2d2d2d;
-            }
-            QTabBar::tab {
-                background-color: #3c3c3c;
-                color: #d4d4d4;
-                padding: 8px 16px;
-                border: 1px solid #404040;
-                border-bottom: none;
-            }
-            QTabBar::tab:selected {
-                background-color: #2d2d2d;
-                border-bottom: 1px solid #2d2d2d;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 8px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLineEdit, QSpinBox, QComboBox {
-                background-color: #3c3c3c;
-                border: 1px solid #505050;
-                border-radius: 3px;
-                padding: 4px 8px;
-                color: #d4d4d4;
-            }
-            QLineEdit:focus, QSpinBox:focus, QComboBox:focus {
-                border-color: #0078d4;
-            }
-            QLineEdit:disabled {
-                background-color: #2a2a2a;
-                color: #808080;
-            }
-            QTreeWidget {
-                background-color: #1e1e1e;
-                border: 1px solid #404040;
-                border-radius: 4px;
-            }
-            QTreeWidget::item {
-                padding: 4px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #094771;
-            }
-            QTreeWidget::item:hover {
-                background-color: #2a2d2e;
-            }
-            QPushButton {
-                background-color: #3c3c3c;
-                border: 1px solid #505050;
-                border-radius: 4px;
-                padding: 6px 16px;
-                color: #d4d4d4;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-            QPushButton#connectButton {
-                background-color: #2d5a2d;
-                border-color: #3d7a3d;
-            }
-            QPushButton#connectButton:hover {
-                background-color: #3d7a3d;
-            }
-            QPushButton#cancelButton {
-                background-color: #5a2d2d;
-                border-color: #7a3d3d;
-            }
-            QPushButton#cancelButton:hover {
-                background-color: #7a3d3d;
-            }
-            QLabel#authSummary {
-                color: #4ec9b0;
-                font-family: monospace;
-                padding: 4px;
-                background-color: #1e1e1e;
-                border-radius: 3px;
-            }
-            QLabel#authWarning {
-                color: #cca700;
-            }
-        """)
+        palette = self.palette()
+        for role, color in _SSH_DIALOG_COLORS.items():
+            palette.setColor(role, QColor(color))
+        self.setPalette(palette)
+        self.setStyleSheet(_SSH_DIALOG_QSS)
 
     def _create_sessions_tab(self) -> QWidget:
         """Create the sessions tree tab."""
@@ -270,20 +371,29 @@ class SSHConnectionDialog(QDialog):
         refresh_btn = QPushButton("↻")
         refresh_btn.setFixedWidth(30)
         refresh_btn.setToolTip("Reload sessions.yaml")
-        refresh_btn.clicked.connect(self._load_sessions)
+        refresh_btn.clicked.connect(lambda: self._load_sessions(force=True))
         tree_header.addWidget(refresh_btn)
         tree_layout.addLayout(tree_header)
 
-        # Tree view
-        self._session_tree = QTreeWidget()
+        # Tree view (model reads config.session_folders directly)
+        self._session_model = SessionTreeModel(get_config(), self)
+        self._session_tree = QTreeView()
         self._session_tree.setHeaderHidden(True)
         self._session_tree.setRootIsDecorated(True)
+        self._session_tree.setUniformRowHeights(True)
+        self._session_tree.setAnimated(False)
+        self._session_tree.setModel(self._session_model)
         self._session_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self._session_tree.customContextMenuRequested.connect(self._on_tree_context_menu)
-        self._session_tree.itemClicked.connect(self._on_session_selected)
-        self._session_tree.itemDoubleClicked.connect(self._on_session_double_click)
+        self._session_tree.clicked.connect(self._on_session_selected)
+        self._session_tree.doubleClicked.connect(self._on_session_double_click)
         tree_layout.addWidget(self._session_tree)
 
+        self._empty_label = QLabel("No sessions configured")
+        self._empty_label.setStyleSheet("color: #808080; font-style: italic;")
+        self._empty_label.setVisible(False)
+        tree_layout.addWidget(self._empty_label)
+
         splitter.addWidget(tree_widget)
 
         # === Right side: Details + Auth ===
@@ -333,7 +443,7 @@ class SSHConnectionDialog(QDialog):
         override_fields.addWidget(QLabel("Username:"), 0, 0)
         self._override_username = QLineEdit()
         self._override_username.setPlaceholderText("(from credential)")
-        self._override_username.textChanged.connect(self._update_auth_summary)
+        self._override_username.textChanged.connect(self._summary_timer.start)
         override_fields.addWidget(self._override_username, 0, 1, 1, 2)
 
         # Auth method override
@@ -349,7 +459,7 @@ class SSHConnectionDialog(QDialog):
         self._override_password = QLineEdit()
         self._override_password.setEchoMode(QLineEdit.EchoMode.Password)
         self._override_password.setPlaceholderText("(leave empty to prompt)")
-        self._override_password.textChanged.connect(self._update_auth_summary)
+        self._override_password.textChanged.connect(self._summary_timer.start)
         override_fields.addWidget(self._override_password, 2, 1, 1, 2)
 
         # Key file field
@@ -357,7 +467,7 @@ class SSHConnectionDialog(QDialog):
         override_fields.addWidget(self._override_key_label, 3, 0)
         self._override_key = QLineEdit()
         self._override_key.setPlaceholderText("(default: ~/.ssh/id_*)")
-        self._override_key.textChanged.connect(self._update_auth_summary)
+        self._override_key.textChanged.connect(self._summary_timer.start)
         override_fields.addWidget(self._override_key, 3, 1)
         self._override_key_browse = QPushButton("...")
         self._override_key_browse.setFixedWidth(30)
@@ -405,6 +515,12 @@ class SSHConnectionDialog(QDialog):
 
         return widget
 
+    def _on_tab_changed(self, index: int):
+        """Build the Manual tab on first activation."""
+        if index == 1 and not self._manual_tab_built:
+            self._manual_tab_built = True
+            self._manual_tab.layout().addWidget(self._create_manual_tab())
+
     def _create_manual_tab(self) -> QWidget:
         """Create manual connection entry tab."""
         widget = QWidget()
@@ -429,7 +545,7 @@ class SSHConnectionDialog(QDialog):
 
         host_layout.addWidget(QLabel("Username:"), 1, 0)
         self._username_edit = QLineEdit()
-        self._username_edit.setPlaceholderText(os.environ.get('USER', 'username'))
+        self._username_edit.setPlaceholderText(DEFAULT_USER)
         host_layout.addWidget(self._username_edit, 1, 1, 1, 3)
 
         layout.addWidget(host_group)
@@ -463,34 +579,10 @@ class SSHConnectionDialog(QDialog):
         password_layout.setColumnStretch(1, 1)
         self._auth_stack.addWidget(password_page)
 
-        # Key file page
-        key_page = QWidget()
-        key_layout = QGridLayout(key_page)
-        key_layout.setContentsMargins(0, 8, 0, 0)
-        key_layout.addWidget(QLabel("Key File:"), 0, 0)
-        self._key_edit = QLineEdit()
-        self._key_edit.setPlaceholderText("(default: ~/.ssh/id_*)")
-        key_layout.addWidget(self._key_edit, 0, 1)
-        browse_btn = QPushButton("Browse...")
-        browse_btn.clicked.connect(self._browse_key_file)
-        key_layout.addWidget(browse_btn, 0, 2)
-        key_layout.addWidget(QLabel("Passphrase:"), 1, 0)
-        self._passphrase_edit = QLineEdit()
-        self._passphrase_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self._passphrase_edit.setPlaceholderText("(if key is encrypted)")
-        key_layout.addWidget(self._passphrase_edit, 1, 1, 1, 2)
-        key_layout.setColumnStretch(1, 1)
-        self._auth_stack.addWidget(key_page)
-
-        # Agent page
-        agent_page = QWidget()
-        agent_layout = QVBoxLayout(agent_page)
-        agent_layout.setContentsMargins(0, 8, 0, 0)
-        agent_label = QLabel("Will use keys from running SSH agent (ssh-agent)\nAlso tries default keys in ~/.ssh/")
-        agent_label.setStyleSheet("color: #808080; font-style: italic;")
-        agent_layout.addWidget(agent_label)
-        agent_layout.addStretch()
-        self._auth_stack.addWidget(agent_page)
+        # Key file / agent pages are built on first selection
+        self._key_edit: Optional[QLineEdit] = None
+        self._passphrase_edit: Optional[QLineEdit] = None
+        self._auth_page_builders = (self._create_key_page, self._create_agent_page)
 
         auth_layout.addWidget(self._auth_stack)
         layout.addWidget(auth_group)
@@ -503,48 +595,39 @@ class SSHConnectionDialog(QDialog):
     # Session loading
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _load_sessions(self):
-        """Load sessions from config into tree."""
-        self._session_tree.clear()
+    def _load_sessions(self, force: bool = False):
+        """
+        Load sessions from config into tree.
 
+        The YAML files are only re-parsed if they changed on disk since the
+        last load, or when force is set (refresh button).
+        """
+        self._save_pool.waitForDone()  # Never read a half-written file
         config = get_config()
-        config.load_sessions()  # Reload from disk
-
-        for folder in config.session_folders:
-            folder_item = QTreeWidgetItem([f"📁 {folder.folder_name}"])
-            folder_item.setData(0, Qt.ItemDataRole.UserRole, ("folder", folder.folder_name))
-            folder_item.setExpanded(False)
-
-            for session in folder.sessions:
-                session_text = session.display_name or session.host
-                session_item = QTreeWidgetItem([f"  🖥 {session_text}"])
-                session_item.setData(0, Qt.ItemDataRole.UserRole, ("session", session))
-                session_item.setToolTip(0, f"{session.host}:{session.port}")
-                folder_item.addChild(session_item)
+        config.load_sessions(force)
+        config.load_credentials(force)
+        if force:
+            _found_key_files.clear()
 
-            self._session_tree.addTopLevelItem(folder_item)
+        # Keep the tree (and its expansion state) if nothing changed
+        if config.sessions_version == self._sessions_version:
+            return
+        self._sessions_version = config.sessions_version
 
-        # Show message if no sessions
-        if not config.session_folders:
-            empty_item = QTreeWidgetItem(["No sessions configured"])
-            empty_item.setData(0, Qt.ItemDataRole.UserRole, None)
-            empty_item.setDisabled(True)
-            self._session_tree.addTopLevelItem(empty_item)
+        self._session_model.reset()
+        self._empty_label.setVisible(not config.session_folders)
 
     def _on_tree_context_menu(self, pos):
         """Show context menu for session tree."""
-        item = self._session_tree.itemAt(pos)
+        session = self._session_model.session_at(self._session_tree.indexAt(pos))
         menu = QMenu(self)
 
-        if item:
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if data and data[0] == "session":
-                session = data[1]
-                edit_action = menu.addAction("✏️ Edit Session")
-                edit_action.triggered.connect(lambda: self._edit_session(session))
-                delete_action = menu.addAction("🗑️ Delete Session")
-                delete_action.triggered.connect(lambda: self._delete_session(session))
-                menu.addSeparator()
+        if session is not None:
+            edit_action = menu.addAction("✏️ Edit Session")
+            edit_action.triggered.connect(lambda: self._edit_session(session))
+            delete_action = menu.addAction("🗑️ Delete Session")
+            delete_action.triggered.connect(lambda: self._delete_session(session))
+            menu.addSeparator()
 
         add_session_action = menu.addAction("➕ Add Session")
         add_session_action.triggered.connect(self._add_session)
@@ -557,16 +640,15 @@ class SSHConnectionDialog(QDialog):
     # Session selection handlers
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _on_session_selected(self, item: QTreeWidgetItem, column: int):
+    def _on_session_selected(self, index: QModelIndex):
         """Handle session selection in tree."""
-        data = item.data(0, Qt.ItemDataRole.UserRole)
+        session = self._session_model.session_at(index)
 
-        if data is None or data[0] == "folder":
+        if session is None:
             self._selected_session = None
             self._clear_session_details()
             return
 
-        session = data[1]
         self._selected_session = session
         self._populate_session_details(session)
         self._update_auth_summary()
@@ -585,7 +667,7 @@ class SSHConnectionDialog(QDialog):
 
     def _populate_session_details(self, session: SessionInfo):
         """Populate session details panel."""
-        self._detail_name.setText(session.display_name or session.host)
+        self._detail_name.setText(session.label)
         self._detail_host.setText(session.host)
         self._detail_port.setText(str(session.port))
         self._detail_type.setText(session.DeviceType or "linux")
@@ -602,18 +684,18 @@ class SSHConnectionDialog(QDialog):
         config = get_config()
         cred = config.get_credential_for_session(session)
         if cred:
-            auth_icon = {"password": "🔑", "key": "🔐", "agent": "🔓"}.get(cred.auth_method, "")
+            auth_icon = AUTH_ICONS.get(cred.auth_method, "")
             self._detail_cred.setText(f"{auth_icon} {cred.name} ({cred.username})")
         elif session.username:
             self._detail_cred.setText(f"Direct: {session.username}")
         else:
             self._detail_cred.setText("(will use current user)")
 
-    def _on_session_double_click(self, item: QTreeWidgetItem, column: int):
+    def _on_session_double_click(self, index: QModelIndex):
         """Handle double-click on session - connect immediately."""
-        data = item.data(0, Qt.ItemDataRole.UserRole)
-        if data and data[0] == "session":
-            self._selected_session = data[1]
+        session = self._session_model.session_at(index)
+        if session is not None:
+            self._selected_session = session
             self._on_accept()
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -658,107 +740,158 @@ class SSHConnectionDialog(QDialog):
         config = get_config()
         cred = config.get_credential_for_session(session)
 
-        # Start with defaults
-        auth = ResolvedAuth()
-        auth.source = "default"
-        auth.auth_method = "agent"  # Safe default - tries agent then keys
-
-        # Layer 1: Session direct auth (if no credential)
+        # Layers merge left to right; later layers win per field
+        defaults = {"auth_method": "agent"}  # Safe default - tries agent then keys
+        source = "default"
+
+        # Layer 1: Session direct auth (only the fields it sets)
+        session_layer = {
+            "username": session.username,
+            "auth_method": session.auth_method,
+            "key_file": session.key_file,
+        }
+        session_layer = {k: v for k, v in session_layer.items() if v}
         if session.username:
-            auth.username = session.username
-            auth.source = "session"
-        if session.auth_method:
-            auth.auth_method = session.auth_method
-        if session.key_file:
-            auth.key_file = session.key_file
-
-        # Layer 2: Credential (overrides session)
+            source = "session"
+
+        # Layer 2: Credential (replaces all auth fields)
+        cred_layer = {}
         if cred:
-            auth.username = cred.username
-            auth.auth_method = cred.auth_method
-            auth.password = cred.password
-            auth.key_file = cred.key_file
-            auth.key_passphrase = cred.key_passphrase
-            auth.source = f"credential:{cred.name}"
+            cred_layer = {
+                "username": cred.username,
+                "auth_method": cred.auth_method,
+                "password": cred.password,
+                "key_file": cred.key_file,
+                "key_passphrase": cred.key_passphrase,
+            }
+            source = f"credential:{cred.name}"
 
         # Layer 3: Override (if enabled)
-        if self._override_enabled.isChecked():
-            override_username = self._override_username.text().strip()
-            if override_username:
-                auth.username = override_username
-                auth.source = "override"
-
-            override_method_idx = self._override_method.currentIndex()
-            if override_method_idx > 0:  # Not "from credential"
-                auth.auth_method = ["password", "key", "agent"][override_method_idx - 1]
-                auth.source = "override"
-
-                if auth.auth_method == "password":
-                    override_pass = self._override_password.text()
-                    if override_pass:
-                        auth.password = override_pass
-                elif auth.auth_method == "key":
-                    override_key = self._override_key.text().strip()
-                    if override_key:
-                        auth.key_file = override_key
-                    auth.key_passphrase = self._override_passphrase.text()
-
-            # Password override even with "from credential" method
-            elif self._override_password.text():
-                auth.password = self._override_password.text()
-                auth.source = "override"
+        override_layer = self._override_layer()
+        if override_layer:
+            source = "override"
+
+        merged = {**defaults, **session_layer, **cred_layer, **override_layer}
 
         # Fallback username
-        if not auth.username:
-            auth.username = os.environ.get('USER', '')
+        if not merged.get("username"):
+            merged["username"] = DEFAULT_USER
+
+        return ResolvedAuth(**merged, source=source)
+
+    def _override_layer(self) -> dict:
+        """Auth fields set by the override group (empty if disabled/unused)."""
+        if not self._override_enabled.isChecked():
+            return {}
 
-        return auth
+        layer = {}
+        override_username = self._override_username.text().strip()
+        if override_username:
+            layer["username"] = override_username
+
+        override_method_idx = self._override_method.currentIndex()
+        if override_method_idx > 0:  # Not "from credential"
+            layer["auth_method"] = _AUTH_METHODS[override_method_idx - 1]
+
+            if layer["auth_method"] == "password":
+                if self._override_password.text():
+                    layer["password"] = self._override_password.text()
+            elif layer["auth_method"] == "key":
+                override_key = self._override_key.text().strip()
+                if override_key:
+                    layer["key_file"] = override_key
+                layer["key_passphrase"] = self._override_passphrase.text()
+
+        # Password override even with "from credential" method
+        elif self._override_password.text():
+            layer["password"] = self._override_password.text()
+
+        return layer
 
     def _update_auth_summary(self):
         """Update the auth summary display."""
+        self._summary_timer.stop()  # Direct refresh supersedes a pending one
         auth = self._resolve_auth()
         self._resolved_auth = auth
 
         if not auth:
             self._auth_summary_label.setText("Select a session")
+            self._auth_warnings = []
             self._auth_warning_label.setVisible(False)
             return
 
         # Build summary text
-        method_names = {"password": "Password", "key": "Key File", "agent": "SSH Agent"}
-        method_str = method_names.get(auth.auth_method, auth.auth_method)
-
-        if auth.auth_method == "key":
-            if auth.key_file:
-                key_name = os.path.basename(os.path.expanduser(auth.key_file))
-                method_str = f"Key: {key_name}"
-            else:
-                method_str = "Key: (default ~/.ssh/id_*)"
-        elif auth.auth_method == "password":
-            if auth.password:
-                method_str = "Password: ●●●●●●●●"
-            else:
-                method_str = "Password: (will prompt)"
-        elif auth.auth_method == "agent":
-            method_str = "SSH Agent + default keys"
+        formatter = _AUTH_SUMMARY_FORMATTERS.get(auth.auth_method)
+        method_str = formatter(auth) if formatter else auth.auth_method
 
         summary = f"User: {auth.username or '(current user)'}\nAuth: {method_str}\nSource: {auth.source}"
         self._auth_summary_label.setText(summary)
 
-        # Show warnings (non-blocking)
-        warnings = auth.get_warnings()
-        if warnings:
-            self._auth_warning_label.setText("⚠ " + "\n⚠ ".join(warnings))
+        # Show warnings (non-blocking); the key file stat reports back later
+        self._auth_warnings = auth.get_warnings(check_files=False)
+        self._show_auth_warnings()
+
+        if auth.auth_method == "key" and auth.key_file:
+            self._key_check_pool.start(_KeyFileCheckTask(auth.key_file, self._key_check_signals))
+
+    def _show_auth_warnings(self):
+        """Render the current warning list."""
+        if self._auth_warnings:
+            self._auth_warning_label.setText("⚠ " + "\n⚠ ".join(self._auth_warnings))
             self._auth_warning_label.setVisible(True)
         else:
             self._auth_warning_label.setVisible(False)
 
+    def _on_key_file_checked(self, key_file: str, exists: bool):
+        """Background key file stat finished; ignore stale results."""
+        auth = self._resolved_auth
+        if exists or not auth or auth.auth_method != "key" or auth.key_file != key_file:
+            return
+        warning = f"Key file not found: {key_file}"
+        if warning not in self._auth_warnings:
+            self._auth_warnings.append(warning)
+            self._show_auth_warnings()
+
     # ─────────────────────────────────────────────────────────────────────────
     # Manual tab handlers
     # ─────────────────────────────────────────────────────────────────────────
 
+    def _create_key_page(self) -> QWidget:
+        """Build the key file auth page."""
+        key_page = QWidget()
+        key_layout = QGridLayout(key_page)
+        key_layout.setContentsMargins(0, 8, 0, 0)
+        key_layout.addWidget(QLabel("Key File:"), 0, 0)
+        self._key_edit = QLineEdit()
+        self._key_edit.setPlaceholderText("(default: ~/.ssh/id_*)")
+        key_layout.addWidget(self._key_edit, 0, 1)
+        browse_btn = QPushButton("Browse...")
+        browse_btn.clicked.connect(self._browse_key_file)
+        key_layout.addWidget(browse_btn, 0, 2)
+        key_layout.addWidget(QLabel("Passphrase:"), 1, 0)
+        self._passphrase_edit = QLineEdit()
+        self._passphrase_edit.setEchoMode(QLineEdit.EchoMode.Password)
+        self._passphrase_edit.setPlaceholderText("(if key is encrypted)")
+        key_layout.addWidget(self._passphrase_edit, 1, 1, 1, 2)
+        key_layout.setColumnStretch(1, 1)
+        return key_page
+
+    def _create_agent_page(self) -> QWidget:
+        """Build the SSH agent auth page."""
+        agent_page = QWidget()
+        agent_layout = QVBoxLayout(agent_page)
+        agent_layout.setContentsMargins(0, 8, 0, 0)
+        agent_label = QLabel("Will use keys from running SSH agent (ssh-agent)\nAlso tries default keys in ~/.ssh/")
+        agent_label.setStyleSheet("color: #808080; font-style: italic;")
+        agent_layout.addWidget(agent_label)
+        agent_layout.addStretch()
+        return agent_page
+
     def _on_auth_method_changed(self, index: int):
-        """Handle auth method combo change."""
+        """Handle auth method combo change (builds the page on first use)."""
+        while self._auth_stack.count() <= index:
+            builder = self._auth_page_builders[self._auth_stack.count() - 1]
+            self._auth_stack.addWidget(builder())
         self._auth_stack.setCurrentIndex(index)
 
     def _browse_key_file(self):
@@ -767,21 +900,21 @@ class SSHConnectionDialog(QDialog):
 
     def _browse_key_file_to(self, target_edit: QLineEdit):
         """Browse for key file and set to target line edit."""
-        ssh_dir = os.path.expanduser("~/.ssh")
-        if not os.path.isdir(ssh_dir):
-            ssh_dir = os.path.expanduser("~")
-
-        path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select SSH Private Key",
-            ssh_dir,
-            "All Files (*)"
-        )
+        if self._key_file_dialog is None:
+            # Stat once per dialog; home may be on a slow network mount
+            ssh_dir = _DEFAULT_SSH_DIR if os.path.isdir(_DEFAULT_SSH_DIR) else _HOME_DIR
+            self._key_file_dialog = QFileDialog(self, "Select SSH Private Key", ssh_dir, "All Files (*)")
+            self._key_file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+
+        if not self._key_file_dialog.exec():
+            return
+        files = self._key_file_dialog.selectedFiles()
+        path = files[0] if files else ""
         if path:
+            _found_key_files.clear()  # Re-check paths after browsing
             # Shorten path if in ~/.ssh
-            home = os.path.expanduser("~")
-            if path.startswith(home):
-                path = "~" + path[len(home):]
+            if path.startswith(_HOME_DIR):
+                path = "~" + path[len(_HOME_DIR):]
             target_edit.setText(path)
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -817,12 +950,12 @@ class SSHConnectionDialog(QDialog):
         self._connection_info = SSHConnectionInfo(
             host=session.host,
             port=session.get_port_int(),
-            username=auth.username or os.environ.get('USER', ''),
+            username=auth.username or DEFAULT_USER,
             auth_method=auth.auth_method,
             password=auth.password,
             key_file=auth.key_file,
             key_passphrase=auth.key_passphrase,
-            display_name=session.display_name or f"{auth.username}@{session.host}",
+            display_name=session.display_name,  # empty -> get_display_name()
             auth_source=auth.source,
         )
 
@@ -838,9 +971,9 @@ class SSHConnectionDialog(QDialog):
 
         username = self._username_edit.text().strip()
         if not username:
-            username = os.environ.get('USER', '')
+            username = DEFAULT_USER
 
-        auth_method = ["password", "key", "agent"][self._auth_combo.currentIndex()]
+        auth_method = _AUTH_METHODS[self._auth_combo.currentIndex()]
 
         password = ""
         key_file = ""
@@ -850,7 +983,7 @@ class SSHConnectionDialog(QDialog):
             password = self._password_edit.text()
             # Empty password is OK - server will prompt
 
-        elif auth_method == "key":
+        elif auth_method == "key" and self._key_edit is not None:
             key_file = self._key_edit.text().strip()
             # Empty key_file is OK - will use defaults
             key_passphrase = self._passphrase_edit.text()
@@ -880,10 +1013,12 @@ class SSHConnectionDialog(QDialog):
 
     def _open_session_manager(self):
         """Open the session manager dialog."""
+        self._save_pool.waitForDone()
         try:
             from .session_manager import SessionManagerDialog
-            dialog = SessionManagerDialog(self)
-            dialog.exec()
+            # The manager edits config.session_folders through its own model
+            with self._session_model.suspended():
+                SessionManagerDialog(self).exec()
             self._load_sessions()  # Refresh tree
         except ImportError:
             QMessageBox.information(
@@ -911,10 +1046,12 @@ class SSHConnectionDialog(QDialog):
 
     def _add_session(self):
         """Add a new session."""
+        self._save_pool.waitForDone()
         try:
             from .session_manager import SessionEditorDialog
-            dialog = SessionEditorDialog(self)
-            if dialog.exec():
+            with self._session_model.suspended():
+                accepted = SessionEditorDialog(self).exec()
+            if accepted:
                 self._load_sessions()
         except ImportError:
             QMessageBox.information(
@@ -924,10 +1061,12 @@ class SSHConnectionDialog(QDialog):
 
     def _edit_session(self, session: SessionInfo):
         """Edit an existing session."""
+        self._save_pool.waitForDone()
         try:
             from .session_manager import SessionEditorDialog
-            dialog = SessionEditorDialog(self, session=session)
-            if dialog.exec():
+            with self._session_model.suspended():
+                accepted = SessionEditorDialog(self, session=session).exec()
+            if accepted:
                 self._load_sessions()
         except ImportError:
             QMessageBox.information(
@@ -939,14 +1078,14 @@ class SSHConnectionDialog(QDialog):
         """Delete a session."""
         result = QMessageBox.question(
             self, "Delete Session",
-            f"Delete session '{session.display_name or session.host}'?",
+            f"Delete session '{session.label}'?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if result == QMessageBox.StandardButton.Yes:
             config = get_config()
             config.remove_session(session.host, session.get_port_int())
-            config.save_sessions()
             self._load_sessions()
+            self._save_sessions_async()
 
     def _add_folder(self):
         """Add a new folder."""
@@ -956,5 +1095,28 @@ class SSHConnectionDialog(QDialog):
             config = get_config()
             from .config_manager import SessionFolder
             config.session_folders.append(SessionFolder(folder_name=name))
-            config.save_sessions()
-            self._load_sessions()
\ No newline at end of file
+            config.mark_sessions_changed()
+            self._load_sessions()
+            self._save_sessions_async()
+
+    def _save_sessions_async(self):
+        """Write sessions.yaml on the save thread; the tree is already updated."""
+        if self._save_signals is None:
+            self._save_signals = SaveSessionsSignals(self)
+            self._save_signals.finished.connect(self._on_sessions_saved)
+        config = get_config()
+        self._save_pool.start(SaveSessionsTask(config, config.sessions_data(), self._save_signals))
+
+    def _on_sessions_saved(self, ok: bool):
+        """Report a failed background write."""
+        if not ok:
+            QMessageBox.warning(
+                self, "Save Failed",
+                f"Could not write {get_config().sessions_file}.\n\n"
+                "The change applies to this session only."
+            )
+
+    def done(self, result: int):
+        """Let a pending sessions.yaml write finish before closing."""
+        self._save_pool.waitForDone()
+        super().done(result)
\ No newline at end of file
@@ -7,22 +7,37 @@ local PTY or remote SSH transparently.
 
 import os
 import sys
+import importlib.util
+import selectors
 import threading
-import queue
 import socket
+import weakref
+from collections import deque
 from typing import Optional, List, Dict
 from dataclasses import dataclass
 
-try:
-    import paramiko
-    from paramiko import SSHClient, AutoAddPolicy, RSAKey, Ed25519Key, ECDSAKey
+from .config_manager import DEFAULT_USER
+from .pty_process import PtyProcess, PtySize
 
-    HAS_PARAMIKO = True
-except ImportError:
-    HAS_PARAMIKO = False
-    paramiko = None
 
-from .pty_process import PtyProcess, PtySize
+# paramiko (and cryptography behind it) is slow to import, so it is
+# loaded by _load_paramiko() when the first session is created
+paramiko = None
+
+
+def _load_paramiko():
+    """Import paramiko on first use and return the module."""
+    global paramiko
+    if paramiko is None:
+        try:
+            import paramiko as _paramiko
+        except ImportError:
+            raise ImportError(
+                "paramiko is required for SSH support. "
+                "Install with: pip install paramiko"
+            ) from None
+        paramiko = _paramiko
+    return paramiko
 
 
 class SSHAuthError(Exception):
@@ -35,6 +50,112 @@ class SSHConnectionError(Exception):
     pass
 
 
+class _ChannelReader:
+    """
+    Reader thread body for one SSHSession connection.
+
+    Shares the session's queue, lock and sockets but holds no reference
+    to the session itself, so a session dropped without close() can
+    still be collected (and its finalizer run) while this thread lives.
+    The stop socket's read end belongs to the reader: it is closed here
+    on exit, never under a select() still waiting on it.
+    """
+
+    def __init__(self, channel: "paramiko.Channel", read_queue: deque,
+                 read_lock: threading.Lock, wake_w: socket.socket,
+                 stop_event: threading.Event, stop_r: socket.socket,
+                 read_chunk: int, read_batch: int):
+        self._channel = channel
+        self._read_queue = read_queue
+        self._read_lock = read_lock
+        self._wake_w = wake_w
+        self._stop_event = stop_event
+        self._stop_r = stop_r
+        self._read_chunk = read_chunk
+        self._read_batch = read_batch
+
+        self.done = False  # Saw EOF/close; set under read_lock
+        self.exit_code: Optional[int] = None
+
+    def run(self):
+        """
+        Background thread to read from channel.
+
+        Sleeps in select() on the channel's event pipe and the stop socket,
+        so an idle session costs no wake-ups.
+        """
+        channel = self._channel
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(channel.fileno(), selectors.EVENT_READ)
+            selector.register(self._stop_r, selectors.EVENT_READ)
+        except Exception:
+            selector.close()
+            self._stop_r.close()
+            return
+
+        while not self._stop_event.is_set():
+            try:
+                selector.select()
+                if self._stop_event.is_set():
+                    break
+                if channel.recv_ready():
+                    data = channel.recv(self._read_chunk)
+                elif channel.recv_stderr_ready():
+                    # Rare with a PTY, but unread stderr keeps the pipe readable
+                    data = channel.recv_stderr(self._read_chunk)
+                elif channel.eof_received or channel.closed:
+                    break
+                else:
+                    continue  # Woken just ahead of the data
+            except Exception:
+                break
+
+            if not data:
+                # Channel closed
+                break
+
+            # Take whatever else paramiko has buffered without blocking
+            if channel.recv_ready():
+                parts = [data]
+                total = len(data)
+                while total < self._read_batch and channel.recv_ready():
+                    more = channel.recv(self._read_chunk)
+                    if not more:
+                        break
+                    parts.append(more)
+                    total += len(more)
+                data = b''.join(parts)
+
+            with self._read_lock:
+                if not self._read_queue:
+                    self._notify()
+                self._read_queue.append(data)
+
+        selector.close()
+        self._stop_r.close()
+
+        # Channel closed - get exit status (unless close() got there first)
+        if not self._stop_event.is_set():
+            try:
+                self.exit_code = channel.recv_exit_status()
+            except Exception:
+                self.exit_code = -1
+
+        # Wake the consumer so it notices the session ended; read() leaves
+        # the fd readable from here on so this wake-up can't be drained
+        with self._read_lock:
+            self.done = True
+            self._notify()
+
+    def _notify(self):
+        """Make the wake-up fd readable (caller holds read_lock)."""
+        try:
+            self._wake_w.send(b'\0')
+        except OSError:
+            pass  # Socket buffer full (already readable) or closed
+
+
 class SSHSession(PtyProcess):
     """
     SSH session implementation using Paramiko.
@@ -52,23 +173,47 @@ class SSHSession(PtyProcess):
         # Now use like UnixPty: read(), write(), set_size()
     """
 
+    # Channel timeout; send() gives up after this while the remote window is full
+    WRITE_TIMEOUT = 0.2
+
+    # Channel flow control: a bigger window and packets mean fewer
+    # WINDOW_ADJUST round trips while bulk output (cat, logs) streams in
+    WINDOW_SIZE = 4 * 1024 * 1024
+    MAX_PACKET_SIZE = 128 * 1024
+    READ_CHUNK = 128 * 1024
+
+    # Frames already buffered by paramiko are joined up to this size
+    # into one queue entry (one consumer wake-up per burst)
+    READ_BATCH = 256 * 1024
+
     def __init__(self):
-        if not HAS_PARAMIKO:
-            raise ImportError(
-                "paramiko is required for SSH support. "
-                "Install with: pip install paramiko"
-            )
+        _load_paramiko()
 
-        self._client: Optional[SSHClient] = None
-        self._channel: Optional[paramiko.Channel] = None
+        self._client: Optional["paramiko.SSHClient"] = None
+        self._channel: Optional["paramiko.Channel"] = None
         self._connected = False
-        self._exit_code: Optional[int] = None
 
         # Non-blocking read support
-        self._read_queue: queue.Queue = queue.Queue()
+        self._read_queue: deque = deque()
+        self._read_lock = threading.Lock()
+        # Unread tail of a chunk that overflowed read(size); a memoryview so
+        # reading a big batch in size-sized pieces never re-copies the rest
+        self._leftover = memoryview(b'')
+        self._reader: Optional[_ChannelReader] = None
         self._read_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
 
+        # Self-pipe readable while data (or EOF) is waiting; exposed as `fd`
+        self._wake_r: Optional[socket.socket] = None
+        self._wake_w: Optional[socket.socket] = None
+
+        # Readable once close() wants the reader thread to stop
+        self._stop_r: Optional[socket.socket] = None
+        self._stop_w: Optional[socket.socket] = None
+
+        # Releases the connection if the session is dropped without close()
+        self._finalizer: Optional[weakref.finalize] = None
+
         # Connection info (for display)
         self._host = ""
         self._port = 22
@@ -112,7 +257,7 @@ class SSHSession(PtyProcess):
             self.close()
 
         if username is None:
-            username = os.environ.get('USER', 'root')
+            username = DEFAULT_USER
 
         if size is None:
             size = PtySize(rows=24, cols=80)
@@ -135,8 +280,8 @@ class SSHSession(PtyProcess):
         self._auth_method = auth_method
 
         try:
-            self._client = SSHClient()
-            self._client.set_missing_host_key_policy(AutoAddPolicy())
+            self._client = paramiko.SSHClient()
+            self._client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
             # Build connection kwargs based on auth method
             connect_kwargs = {
@@ -196,28 +341,45 @@ class SSHSession(PtyProcess):
             except Exception as e:
                 raise SSHConnectionError(f"Connection failed: {e}")
 
-            # Open interactive shell channel
+            # Open interactive shell channel (what SSHClient.invoke_shell
+            # does, but with our window/packet sizes)
             try:
-                self._channel = self._client.invoke_shell(
-                    term='xterm-256color',
-                    width=size.cols,
-                    height=size.rows
+                self._channel = self._client.get_transport().open_session(
+                    window_size=self.WINDOW_SIZE,
+                    max_packet_size=self.MAX_PACKET_SIZE
                 )
+                self._channel.get_pty('xterm-256color', size.cols, size.rows)
+                self._channel.invoke_shell()
             except paramiko.SSHException as e:
                 raise SSHConnectionError(f"Could not open shell: {e}")
 
-            # Set non-blocking
-            self._channel.setblocking(0)
+            self._channel.settimeout(self.WRITE_TIMEOUT)
+
+            # Wake-up fd for the consumer (socketpair so it also works on Windows)
+            if self._wake_r is None:
+                self._wake_r, self._wake_w = socket.socketpair()
+                self._wake_r.setblocking(False)
+                self._wake_w.setblocking(False)
+            self._stop_r, self._stop_w = socket.socketpair()
 
             # Start read thread
             self._stop_event.clear()
+            self._reader = _ChannelReader(
+                self._channel, self._read_queue, self._read_lock, self._wake_w,
+                self._stop_event, self._stop_r, self.READ_CHUNK, self.READ_BATCH
+            )
             self._read_thread = threading.Thread(
-                target=self._read_worker,
+                target=self._reader.run,
                 daemon=True,
                 name=f"ssh-reader-{host}"
             )
             self._read_thread.start()
 
+            self._finalizer = weakref.finalize(
+                self, SSHSession._release, self._stop_event, self._stop_w,
+                (self._channel, self._client, self._wake_r, self._wake_w)
+            )
+
             self._connected = True
             return True
 
@@ -245,29 +407,14 @@ class SSHSession(PtyProcess):
                 pass
             self._client = None
 
-    def _read_worker(self):
-        """Background thread to read from channel."""
-        while not self._stop_event.is_set():
-            try:
-                if self._channel and self._channel.recv_ready():
-                    data = self._channel.recv(65536)
-                    if data:
-                        self._read_queue.put(data)
-                    else:
-                        # Channel closed
-                        break
-                else:
-                    # Small sleep to avoid busy-waiting
-                    self._stop_event.wait(0.01)
-            except Exception:
-                break
-
-        # Channel closed - get exit status
-        if self._channel:
+    def _drain_wake(self):
+        """Clear the wake-up fd (caller holds _read_lock)."""
+        if self._wake_r is not None:
             try:
-                self._exit_code = self._channel.recv_exit_status()
-            except Exception:
-                self._exit_code = -1
+                while self._wake_r.recv(4096):
+                    pass
+            except OSError:
+                pass
 
     # ───────────────────────────────────────────────────────────────────────
     # PtyProcess interface implementation
@@ -293,32 +440,65 @@ class SSHSession(PtyProcess):
         Read available data from SSH channel (non-blocking).
 
         Returns:
-            Bytes read, or empty bytes if nothing available
+            Up to `size` bytes read, or empty bytes if nothing available
         """
         if not self._connected:
             return b''
 
-        data = b''
-        try:
-            while True:
-                chunk = self._read_queue.get_nowait()
-                data += chunk
-                if len(data) >= size:
-                    break
-        except queue.Empty:
-            pass
+        chunks = []
+        needed = size
+        if self._leftover:
+            chunks.append(self._leftover[:needed])
+            self._leftover = self._leftover[needed:]
+            needed -= len(chunks[0])
+
+        # Take just enough chunks to fill `size` under one lock acquire;
+        # the part of the last one past `size` becomes the leftover
+        with self._read_lock:
+            queue = self._read_queue
+            while queue and needed > 0:
+                chunk = queue.popleft()
+                if len(chunk) > needed:
+                    view = memoryview(chunk)
+                    self._leftover = view[needed:]
+                    chunk = view[:needed]
+                chunks.append(chunk)
+                needed -= len(chunk)
+
+            # Nothing left queued and no overflow tail: stop signalling
+            # (unless the reader is done - then the fd stays readable)
+            if not queue and not self._leftover and not self._reader.done:
+                self._drain_wake()
+
+        if not chunks:
+            return b''
 
-        return data
+        # Only the returned bytes are copied (a whole queued chunk, not at all)
+        if len(chunks) == 1:
+            return bytes(chunks[0])
+        return b''.join(chunks)
 
     def write(self, data: bytes) -> int:
-        """Write data to SSH channel."""
+        """
+        Write data to SSH channel.
+
+        Channel.send() puts at most one packet on the wire, so a paste is
+        sent as consecutive full-size packets until all of it is out.
+        """
         if not self._channel or not self._connected:
             return 0
 
+        view = memoryview(data)
+        sent = 0
         try:
-            return self._channel.send(data)
+            while sent < len(view):
+                n = self._channel.send(view[sent:])
+                if n == 0:
+                    break  # Channel closed
+                sent += n
         except Exception:
-            return 0
+            pass
+        return sent
 
     def set_size(self, rows: int, cols: int, xpixel: int = 0, ypixel: int = 0):
         """Resize the SSH PTY."""
@@ -339,6 +519,15 @@ class SSHSession(PtyProcess):
     def close(self):
         """Close SSH connection and clean up."""
         self._stop_event.set()
+        if self._stop_w is not None:
+            try:
+                self._stop_w.send(b'\0')  # Wake the reader out of select()
+            except OSError:
+                pass
+
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
 
         if self._channel:
             try:
@@ -355,12 +544,22 @@ class SSHSession(PtyProcess):
             self._client = None
 
         self._connected = False
+        self._leftover = memoryview(b'')
 
         # Wait for read thread
         if self._read_thread and self._read_thread.is_alive():
             self._read_thread.join(timeout=1.0)
         self._read_thread = None
 
+        with self._read_lock:
+            self._read_queue.clear()
+            # _stop_r is closed by the reader thread as it exits
+            for sock in (self._wake_r, self._wake_w, self._stop_w):
+                if sock is not None:
+                    sock.close()
+            self._wake_r = self._wake_w = None
+            self._stop_r = self._stop_w = None
+
     @property
     def pid(self) -> int:
         """Process ID - not applicable for SSH, return -1."""
@@ -372,6 +571,10 @@ class SSHSession(PtyProcess):
         if not self._connected or not self._channel:
             return False
 
+        # EOF seen: alive only until the last of its output has been read
+        if self._reader.done and not (self._read_queue or self._leftover):
+            return False
+
         try:
             transport = self._channel.get_transport()
             if transport is None or not transport.is_active():
@@ -383,26 +586,21 @@ class SSHSession(PtyProcess):
     @property
     def exit_code(self) -> Optional[int]:
         """Exit code of remote shell, None if still running."""
-        if self.is_alive:
+        if self.is_alive or self._reader is None:
             return None
-        return self._exit_code
+        return self._reader.exit_code
 
     @property
     def fd(self) -> int:
         """
-        File descriptor - not directly available for SSH.
+        Wake-up file descriptor for select()/QSocketNotifier.
 
-        Returns the underlying socket fileno for select() compatibility.
+        Readable while read() has data waiting or the channel has closed.
+        It is only a signal: always fetch data with read(), never from
+        the fd itself. Returns -1 when not connected.
         """
-        if self._channel:
-            try:
-                transport = self._channel.get_transport()
-                if transport:
-                    sock = transport.sock
-                    if sock:
-                        return sock.fileno()
-            except Exception:
-                pass
+        if self._wake_r is not None:
+            return self._wake_r.fileno()
         return -1
 
     # ───────────────────────────────────────────────────────────────────────
@@ -459,14 +657,26 @@ class SSHSession(PtyProcess):
                 pass
         return ""
 
-    def __del__(self):
-        """Ensure cleanup on garbage collection."""
-        self.close()
+    @staticmethod
+    def _release(stop_event: threading.Event, stop_w: socket.socket, resources: tuple):
+        """Finalizer: stop the reader and close sockets without joining it."""
+        stop_event.set()
+        try:
+            stop_w.send(b'\0')  # Wake the reader out of select()
+        except OSError:
+            pass
+        stop_w.close()
+        for resource in resources:
+            if resource is not None:
+                try:
+                    resource.close()
+                except Exception:
+                    pass
 
 
 def check_paramiko_available() -> bool:
-    """Check if paramiko is installed."""
-    return HAS_PARAMIKO
+    """Check if paramiko is installed (without importing it)."""
+    return paramiko is not None or importlib.util.find_spec("paramiko") is not None
 
 
 def get_ssh_agent_keys() -> List[Dict[str, str]]:
@@ -476,7 +686,9 @@ def get_ssh_agent_keys() -> List[Dict[str, str]]:
     Returns:
         List of dicts with 'type', 'fingerprint', 'comment'
     """
-    if not HAS_PARAMIKO:
+    try:
+        _load_paramiko()
+    except ImportError:
         return []
 
     try:
@@ -511,15 +723,17 @@ def test_connection(host: str,
     Returns:
         (success: bool, message: str)
     """
-    if not HAS_PARAMIKO:
+    try:
+        _load_paramiko()
+    except ImportError:
         return False, "paramiko not installed"
 
     if username is None:
-        username = os.environ.get('USER', 'root')
+        username = DEFAULT_USER
 
     try:
-        client = SSHClient()
-        client.set_missing_host_key_policy(AutoAddPolicy())
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
         connect_kwargs = {
             'hostname': host,
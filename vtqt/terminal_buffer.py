@@ -103,14 +103,25 @@ class TextBuffer:
     """
     Manages text content with viewport scrolling.
     Can be used for file viewer or terminal scrollback.
+    
+    Content is stored column-wise: one (total_lines, width) array per cell
+    field instead of a Cell object per cell. get_line() builds a Line of
+    Cells on demand for callers that want the object view.
+    
+    to_render_array() keeps its output between calls and repacks only the
+    viewport rows that scrolling or selection changed. Call invalidate()
+    after editing the content arrays or colors directly.
     """
     
     def __init__(self, visible_rows: int, cols: int):
         self.visible_rows = visible_rows
         self.cols = cols
         
-        # All content lines
-        self.lines: List[Line] = []
+        # All content lines: char code, fg/bg RGB, CellAttr bits per cell
+        self.char_codes = np.zeros((0, cols), dtype=np.uint32)
+        self.fg = np.zeros((0, cols), dtype=np.uint32)
+        self.bg = np.zeros((0, cols), dtype=np.uint32)
+        self.attrs = np.zeros((0, cols), dtype=np.uint8)
         
         # Viewport offset (which line is at top of view)
         self.scroll_offset: int = 0
@@ -125,25 +136,37 @@ class TextBuffer:
         
         # Dirty tracking
         self._dirty = True
+        
+        # Last render output and the [start, stop) viewport rows it is
+        # stale for (None = up to date)
+        self._render_cache: Optional[np.ndarray] = None
+        self._stale_rows: Optional[Tuple[int, int]] = None
     
     def load_text(self, text: str):
         """Load text content into buffer."""
-        self.lines.clear()
-        for line_text in text.split('\n'):
-            # Expand tabs
-            line_text = line_text.replace('\t', '    ')
-            self.lines.append(Line.from_text(
-                line_text, self.cols, 
-                self.default_fg, self.default_bg
-            ))
+        cols = self.cols
+        line_texts = text.split('\n')
         
         # Ensure at least visible_rows lines
-        while len(self.lines) < self.visible_rows:
-            self.lines.append(Line.blank(self.cols, self.default_bg))
+        line_texts.extend([''] * (self.visible_rows - len(line_texts)))
+        
+        # Expand tabs, pad/truncate to cols, decode all rows in one go
+        padded = ''.join(
+            line_text.replace('\t', '    ')[:cols].ljust(cols)
+            for line_text in line_texts
+        )
+        codes = np.frombuffer(padded.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        codes = codes.reshape(len(line_texts), cols).copy()
+        codes[codes < 32] = 32  # Non-printable -> space
+        
+        self.char_codes = codes
+        self.fg = np.full(codes.shape, self.default_fg, dtype=np.uint32)
+        self.bg = np.full(codes.shape, self.default_bg, dtype=np.uint32)
+        self.attrs = np.zeros(codes.shape, dtype=np.uint8)
         
         self.scroll_offset = 0
         self.selection.clear()
-        self._dirty = True
+        self.invalidate()
     
     def load_file(self, filepath: str):
         """Load file content into buffer."""
@@ -155,11 +178,64 @@ class TextBuffer:
     
     @property
     def total_lines(self) -> int:
-        return len(self.lines)
+        return self.char_codes.shape[0]
     
     @property
     def max_scroll(self) -> int:
-        return max(0, len(self.lines) - self.visible_rows)
+        return max(0, self.total_lines - self.visible_rows)
+    
+    def line_text(self, row: int) -> str:
+        """Text of a buffer line, trailing blanks stripped."""
+        return self.char_codes[row].tobytes().decode('utf-32-le', 'surrogatepass').rstrip()
+    
+    def get_text(self) -> str:
+        """Whole buffer as text, one stripped line per row."""
+        return '\n'.join(self.line_text(row) for row in range(self.total_lines))
+    
+    def get_line(self, row: int) -> Line:
+        """Build a Line of Cells for a buffer row."""
+        return Line(cells=[
+            Cell(char=chr(code), fg=fg, bg=bg, attrs=CellAttr(attrs))
+            for code, fg, bg, attrs in zip(
+                self.char_codes[row].tolist(), self.fg[row].tolist(),
+                self.bg[row].tolist(), self.attrs[row].tolist()
+            )
+        ])
+    
+    # ─────────────────────────────────────────────────────────
+    # Render cache invalidation
+    # ─────────────────────────────────────────────────────────
+    
+    def invalidate(self):
+        """Repack the whole viewport on the next render."""
+        self._render_cache = None
+        self._stale_rows = None
+        self._dirty = True
+    
+    def _mark_rows_stale(self, start: int, stop: int):
+        """Mark viewport rows [start, stop) for repacking."""
+        start, stop = max(start, 0), min(stop, self.visible_rows)
+        if start >= stop:
+            return
+        if self._stale_rows is not None:
+            start = min(start, self._stale_rows[0])
+            stop = max(stop, self._stale_rows[1])
+        self._stale_rows = (start, stop)
+        self._dirty = True
+    
+    def _selection_rows(self) -> Optional[Tuple[int, int]]:
+        """Inclusive buffer rows the selection covers, or None."""
+        if not self.selection.active or self.selection.start_row < 0:
+            return None
+        r1, _, r2, _ = self.selection.normalize()
+        return r1, r2
+    
+    def _mark_selection_change(self, before: Optional[Tuple[int, int]]):
+        """Mark the rows covered before and after a selection edit."""
+        for rows in (before, self._selection_rows()):
+            if rows is not None:
+                self._mark_rows_stale(rows[0] - self.scroll_offset,
+                                      rows[1] - self.scroll_offset + 1)
     
     # ─────────────────────────────────────────────────────────
     # Scrolling
@@ -169,8 +245,10 @@ class TextBuffer:
         """Scroll to specific line offset."""
         new_offset = max(0, min(offset, self.max_scroll))
         if new_offset != self.scroll_offset:
+            delta = new_offset - self.scroll_offset
             self.scroll_offset = new_offset
             self._dirty = True
+            self._shift_render_cache(delta)
     
     def scroll_by(self, delta: int):
         """Scroll by delta lines (positive = down)."""
@@ -186,6 +264,29 @@ class TextBuffer:
     def scroll_to_bottom(self):
         self.scroll_to(self.max_scroll)
     
+    def _shift_render_cache(self, delta: int):
+        """Move cached rows with the content; only exposed rows go stale."""
+        cache = self._render_cache
+        if cache is None:
+            return
+        rows = cache.shape[0]
+        if abs(delta) >= rows:
+            self.invalidate()
+            return
+        
+        stale = self._stale_rows
+        self._stale_rows = None
+        if delta > 0:
+            cache[:-delta] = cache[delta:]
+            self._mark_rows_stale(rows - delta, rows)
+        else:
+            cache[-delta:] = cache[:delta]
+            self._mark_rows_stale(0, -delta)
+        
+        # Rows that were already stale moved too
+        if stale is not None:
+            self._mark_rows_stale(stale[0] - delta, stale[1] - delta)
+    
     # ─────────────────────────────────────────────────────────
     # Selection
     # ─────────────────────────────────────────────────────────
@@ -194,26 +295,28 @@ class TextBuffer:
         """Start text selection at position."""
         # Convert viewport position to buffer position
         buf_row = row + self.scroll_offset
-        if 0 <= buf_row < len(self.lines) and 0 <= col < self.cols:
+        if 0 <= buf_row < self.total_lines and 0 <= col < self.cols:
+            before = self._selection_rows()
             self.selection.start_row = buf_row
             self.selection.start_col = col
             self.selection.end_row = buf_row
             self.selection.end_col = col
             self.selection.active = True
-            self._dirty = True
+            self._mark_selection_change(before)
     
     def update_selection(self, row: int, col: int):
         """Update selection end point."""
         if not self.selection.active:
             return
         buf_row = row + self.scroll_offset
-        buf_row = max(0, min(buf_row, len(self.lines) - 1))
+        buf_row = max(0, min(buf_row, self.total_lines - 1))
         col = max(0, min(col, self.cols - 1))
         
         if self.selection.end_row != buf_row or self.selection.end_col != col:
+            before = self._selection_rows()
             self.selection.end_row = buf_row
             self.selection.end_col = col
-            self._dirty = True
+            self._mark_selection_change(before)
     
     def end_selection(self):
         """Finalize selection."""
@@ -223,8 +326,9 @@ class TextBuffer:
     def clear_selection(self):
         """Clear selection."""
         if self.selection.active:
+            before = self._selection_rows()
             self.selection.clear()
-            self._dirty = True
+            self._mark_selection_change(before)
     
     def get_selected_text(self) -> str:
         """Get text within selection."""
@@ -233,23 +337,23 @@ class TextBuffer:
         
         r1, c1, r2, c2 = self.selection.normalize()
         
+        def text(codes: np.ndarray) -> str:
+            return codes.tobytes().decode('utf-32-le', 'surrogatepass').rstrip()
+        
         if r1 == r2:
             # Single line
-            line = self.lines[r1]
-            return ''.join(c.char for c in line.cells[c1:c2+1]).rstrip()
+            return text(self.char_codes[r1, c1:c2+1])
         
         # Multiple lines
         result = []
-        for row in range(r1, r2 + 1):
-            if row >= len(self.lines):
-                break
-            line = self.lines[row]
+        for row in range(r1, min(r2 + 1, self.total_lines)):
+            codes = self.char_codes[row]
             if row == r1:
-                result.append(''.join(c.char for c in line.cells[c1:]).rstrip())
+                result.append(text(codes[c1:]))
             elif row == r2:
-                result.append(''.join(c.char for c in line.cells[:c2+1]).rstrip())
+                result.append(text(codes[:c2+1]))
             else:
-                result.append(''.join(c.char for c in line.cells).rstrip())
+                result.append(text(codes))
         
         return '\n'.join(result)
     
@@ -262,8 +366,8 @@ class TextBuffer:
         result = []
         for i in range(self.visible_rows):
             buf_idx = self.scroll_offset + i
-            if buf_idx < len(self.lines):
-                result.append(self.lines[buf_idx])
+            if buf_idx < self.total_lines:
+                result.append(self.get_line(buf_idx))
             else:
                 result.append(Line.blank(self.cols, self.default_bg))
         return result
@@ -278,39 +382,82 @@ class TextBuffer:
         Pack visible cells into numpy array for GPU.
         Shape: (rows, cols, 8)
         Data: [char_code, fg_r, fg_g, fg_b, bg_r, bg_g, bg_b, attrs]
+        
+        The same array is returned (and updated in place) until the
+        viewport size changes.
         """
-        data = np.zeros((self.visible_rows, self.cols, 8), dtype=np.float32)
+        shape = (self.visible_rows, self.cols, 8)
+        if self._render_cache is None or self._render_cache.shape != shape:
+            self._render_cache = np.zeros(shape, dtype=np.float32)
+            self._stale_rows = (0, self.visible_rows)
         
-        lines = self.get_visible_lines()
+        if self._stale_rows is not None:
+            start, stop = self._stale_rows
+            self._pack_rows(self._render_cache[start:stop], start)
+            self._stale_rows = None
         
-        for row_idx, line in enumerate(lines):
-            for col_idx, cell in enumerate(line.cells[:self.cols]):
-                # Check selection
-                selected = self.is_selected(row_idx, col_idx)
-                
-                fg = cell.fg
-                bg = self.selection_bg if selected else cell.bg
-                
-                # Reverse video if selected and has REVERSE attr
-                if selected:
-                    attrs = cell.attrs | CellAttr.SELECTED
-                else:
-                    attrs = cell.attrs
-                
-                char_code = ord(cell.char[0]) if cell.char else 32
-                
-                data[row_idx, col_idx] = [
-                    char_code,
-                    ((fg >> 16) & 0xFF) / 255.0,
-                    ((fg >> 8) & 0xFF) / 255.0,
-                    (fg & 0xFF) / 255.0,
-                    ((bg >> 16) & 0xFF) / 255.0,
-                    ((bg >> 8) & 0xFF) / 255.0,
-                    (bg & 0xFF) / 255.0,
-                    float(attrs),
-                ]
+        return self._render_cache
+    
+    def _selection_mask(self, top: int, rows: int, cols: int,
+                        shown: int, width: int) -> Optional[np.ndarray]:
+        """
+        (rows, cols) bool mask of selected cells for buffer rows from top,
+        or None if the selection misses them. Content rows are selectable
+        up to width, blank rows past the content across all cols.
+        """
+        sel_rows = self._selection_rows()
+        if sel_rows is None or sel_rows[1] < top or sel_rows[0] >= top + rows:
+            return None
         
-        return data
+        r1, c1, r2, c2 = self.selection.normalize()
+        buf_row = np.arange(top, top + rows)[:, None]
+        col = np.arange(cols)[None, :]
+        limit = np.where(np.arange(rows) < shown, width, cols)[:, None]
+        
+        return ((buf_row >= r1) & (buf_row <= r2)
+                & ((buf_row != r1) | (col >= c1))
+                & ((buf_row != r2) | (col <= c2))
+                & (col < limit))
+    
+    def _pack_rows(self, data: np.ndarray, first_row: int):
+        """Fill data (a block of viewport rows starting at first_row)."""
+        rows, cols = data.shape[:2]
+        
+        # Slice the rows out of the content arrays. Columns past the
+        # stored width (resized without reload) stay zero; rows past the
+        # end of content render as blank lines.
+        top = self.scroll_offset + first_row
+        shown = max(0, min(rows, self.total_lines - top))
+        width = min(self.char_codes.shape[1], cols)
+        
+        char_codes = np.zeros((rows, cols), dtype=np.uint32)
+        fg_rgb = np.zeros((rows, cols), dtype=np.uint32)
+        bg_rgb = np.zeros((rows, cols), dtype=np.uint32)
+        cell_attrs = np.zeros((rows, cols), dtype=np.uint32)
+        
+        view = slice(top, top + shown)
+        char_codes[:shown, :width] = self.char_codes[view, :width]
+        fg_rgb[:shown, :width] = self.fg[view, :width]
+        bg_rgb[:shown, :width] = self.bg[view, :width]
+        cell_attrs[:shown, :width] = self.attrs[view, :width]
+        
+        char_codes[shown:] = 32
+        fg_rgb[shown:] = self.default_fg
+        bg_rgb[shown:] = self.default_bg
+        
+        selected = self._selection_mask(top, rows, cols, shown, width)
+        if selected is not None:
+            bg_rgb[selected] = self.selection_bg
+            cell_attrs[selected] |= int(CellAttr.SELECTED)
+        
+        data[..., 0] = char_codes
+        data[..., 1] = ((fg_rgb >> 16) & 0xFF) / 255.0
+        data[..., 2] = ((fg_rgb >> 8) & 0xFF) / 255.0
+        data[..., 3] = (fg_rgb & 0xFF) / 255.0
+        data[..., 4] = ((bg_rgb >> 16) & 0xFF) / 255.0
+        data[..., 5] = ((bg_rgb >> 8) & 0xFF) / 255.0
+        data[..., 6] = (bg_rgb & 0xFF) / 255.0
+        data[..., 7] = cell_attrs
     
     def is_dirty(self) -> bool:
         return self._dirty
@@ -323,4 +470,4 @@ class TextBuffer:
         self.visible_rows = visible_rows
         self.cols = cols
         # Reload to re-wrap lines
-        self._dirty = True
+        self.invalidate()
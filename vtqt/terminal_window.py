@@ -4,7 +4,7 @@ Terminal Window - Main window for terminal emulator with SSH support.
 
 from pathlib import Path
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QSocketNotifier, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QScrollBar, QFrame, QMessageBox,
@@ -15,6 +15,45 @@ from .terminal_widget import TerminalWidget
 from .gpu_renderer import CursorStyle
 
 
+# Auth method -> connection banner wording
+_AUTH_BANNER_NAMES = {"password": "password", "key": "key", "agent": "SSH agent"}
+
+
+class _SSHConnectSignals(QObject):
+    """Signals for _SSHConnectTask (QRunnable can't emit)."""
+    finished = pyqtSignal(object, object, object)  # info, session, error or None
+
+
+class _SSHConnectTask(QRunnable):
+    """
+    Creates an SSHSession and runs connect (paramiko import, DNS, TCP,
+    key exchange, auth) on a pool thread.
+    """
+
+    def __init__(self, info, connect_kwargs: dict, signals: _SSHConnectSignals):
+        super().__init__()
+        self._info = info
+        self._connect_kwargs = connect_kwargs
+        self._signals = signals
+
+    def run(self):
+        from .ssh_session import SSHSession
+
+        session = None
+        error = None
+        try:
+            session = SSHSession()
+            session.connect(**self._connect_kwargs)
+        except Exception as e:
+            error = e
+        try:
+            self._signals.finished.emit(self._info, session, error)
+        except RuntimeError:
+            # Window went away while connecting
+            if session is not None:
+                session.close()
+
+
 class TerminalWindow(QMainWindow):
     """Main window with terminal emulator and controls."""
 
@@ -24,8 +63,10 @@ class TerminalWindow(QMainWindow):
         self.setWindowTitle("VelociTermQt")
         self.setMinimumSize(800, 600)
 
-        # SSH polling timer
-        self._ssh_timer = None
+        # Fires when the SSH session's wake-up fd has data/EOF waiting
+        self._ssh_notifier = None
+        self._ssh_connect_signals = _SSHConnectSignals(self)
+        self._ssh_connect_signals.finished.connect(self._on_ssh_connect_done)
         self._is_ssh = False
         self._ssh_info = None  # Store connection info
 
@@ -218,42 +259,64 @@ class TerminalWindow(QMainWindow):
                 self._connect_ssh(info)
 
     def _connect_ssh(self, info):
-        """Establish SSH connection."""
-        from .ssh_session import SSHSession, SSHAuthError, SSHConnectionError
+        """Start an SSH connection; the handshake runs off the UI thread."""
         from .pty_process import PtySize
 
         size = PtySize(rows=self.terminal.rows, cols=self.terminal.cols)
 
-        # Show connecting status
+        # Build connection kwargs from SSHConnectionInfo
+        connect_kwargs = {
+            'host': info.host,
+            'port': info.port,
+            'username': info.username,
+            'size': size,
+            'auth_method': info.auth_method,
+        }
+
+        # Add auth-specific parameters
+        if info.auth_method == "password":
+            connect_kwargs['password'] = info.password
+        elif info.auth_method == "key":
+            connect_kwargs['key_filename'] = info.key_file
+            if info.key_passphrase:
+                connect_kwargs['key_passphrase'] = info.key_passphrase
+        elif info.auth_method == "agent":
+            connect_kwargs['use_agent'] = True
+
+        # Show connecting status; the window stays responsive meanwhile
         self.status_label.setText(f"Connecting to {info.get_display_name()}...")
         self.ssh_btn.setEnabled(False)
-        QApplication.processEvents()
 
-        try:
-            session = SSHSession()
+        QThreadPool.globalInstance().start(
+            _SSHConnectTask(info, connect_kwargs, self._ssh_connect_signals)
+        )
 
-            # Build connection kwargs from SSHConnectionInfo
-            connect_kwargs = {
-                'host': info.host,
-                'port': info.port,
-                'username': info.username,
-                'size': size,
-                'auth_method': info.auth_method,
-            }
+    def _on_ssh_connect_done(self, info, session, error):
+        """Background connect finished: attach the session or report the error."""
+        from .ssh_session import SSHAuthError, SSHConnectionError
 
-            # Add auth-specific parameters
-            if info.auth_method == "password":
-                connect_kwargs['password'] = info.password
-            elif info.auth_method == "key":
-                connect_kwargs['key_filename'] = info.key_file
-                if info.key_passphrase:
-                    connect_kwargs['key_passphrase'] = info.key_passphrase
-            elif info.auth_method == "agent":
-                connect_kwargs['use_agent'] = True
+        self.ssh_btn.setEnabled(True)
 
-            # Attempt connection
-            session.connect(**connect_kwargs)
+        if isinstance(error, SSHAuthError):
+            self._show_auth_error(info, str(error))
+            self.status_label.setText("Authentication failed")
+            return
+        if isinstance(error, SSHConnectionError):
+            QMessageBox.critical(
+                self, "Connection Failed",
+                f"Could not connect to {info.host}:{info.port}\n\n{error}"
+            )
+            self.status_label.setText("Connection failed")
+            return
+        if error is not None:
+            QMessageBox.critical(
+                self, "Error",
+                f"Unexpected error:\n\n{error}"
+            )
+            self.status_label.setText("Connection failed")
+            return
 
+        try:
             # Success - stop local PTY
             if self.terminal._pty:
                 self.terminal._pty.terminate()
@@ -267,22 +330,18 @@ class TerminalWindow(QMainWindow):
             self._is_ssh = True
             self._ssh_info = info
 
-            # Start SSH polling timer
-            if self._ssh_timer:
-                self._ssh_timer.stop()
-            self._ssh_timer = QTimer(self)
-            self._ssh_timer.timeout.connect(self._poll_ssh)
-            self._ssh_timer.start(10)  # 10ms polling
+            # Read whenever the session signals data (no polling)
+            self._stop_ssh_notifier()
+            self._ssh_notifier = QSocketNotifier(session.fd, QSocketNotifier.Type.Read, self)
+            self._ssh_notifier.activated.connect(self._on_ssh_ready)
 
             # Update UI
             self.terminal.buffer.clear()
 
             # Show connection banner
-            auth_desc = {
-                "password": "password",
-                "key": f"key ({info.key_file})" if info.key_file else "key",
-                "agent": "SSH agent"
-            }.get(info.auth_method, info.auth_method)
+            auth_desc = _AUTH_BANNER_NAMES.get(info.auth_method, info.auth_method)
+            if info.auth_method == "key" and info.key_file:
+                auth_desc = f"key ({info.key_file})"
 
             banner = (
                 f"\x1b[32mConnected to {info.host}:{info.port}\x1b[0m\r\n"
@@ -291,10 +350,11 @@ class TerminalWindow(QMainWindow):
             )
             self.terminal.buffer.feed(banner.encode())
 
-            self.setWindowTitle(f"VelociTermQt - {info.get_display_name()}")
-            self.connection_label.setText(info.get_display_name())
+            name = info.get_display_name()
+            self.setWindowTitle(f"VelociTermQt - {name}")
+            self.connection_label.setText(name)
             self.connection_label.setStyleSheet("color: #4a4; font-weight: bold;")
-            self.status_label.setText(f"Connected to {info.get_display_name()}")
+            self.status_label.setText(f"Connected to {name}")
 
             # Show disconnect button, hide SSH button
             self.ssh_btn.setVisible(False)
@@ -302,17 +362,6 @@ class TerminalWindow(QMainWindow):
 
             self.terminal.update()
 
-        except SSHAuthError as e:
-            self._show_auth_error(info, str(e))
-            self.status_label.setText("Authentication failed")
-
-        except SSHConnectionError as e:
-            QMessageBox.critical(
-                self, "Connection Failed",
-                f"Could not connect to {info.host}:{info.port}\n\n{e}"
-            )
-            self.status_label.setText("Connection failed")
-
         except Exception as e:
             QMessageBox.critical(
                 self, "Error",
@@ -320,9 +369,6 @@ class TerminalWindow(QMainWindow):
             )
             self.status_label.setText("Connection failed")
 
-        finally:
-            self.ssh_btn.setEnabled(True)
-
     def _show_auth_error(self, info, error_msg: str):
         """Show authentication error with helpful details."""
         auth_help = {
@@ -354,11 +400,17 @@ class TerminalWindow(QMainWindow):
             f"Suggestions:\n{help_text}"
         )
 
-    def _poll_ssh(self):
-        """Poll SSH session for data."""
+    def _stop_ssh_notifier(self):
+        """Detach the SSH read notifier (before the session fd is closed)."""
+        if self._ssh_notifier:
+            self._ssh_notifier.setEnabled(False)
+            self._ssh_notifier.deleteLater()
+            self._ssh_notifier = None
+
+    def _on_ssh_ready(self):
+        """SSH session has data waiting (or has closed)."""
         if not self.terminal._pty or not self.terminal._pty.is_alive:
-            if self._ssh_timer:
-                self._ssh_timer.stop()
+            self._stop_ssh_notifier()
             self._on_ssh_disconnected()
             return
 
@@ -370,9 +422,7 @@ class TerminalWindow(QMainWindow):
 
     def _disconnect_ssh(self):
         """Disconnect SSH and return to local shell."""
-        if self._ssh_timer:
-            self._ssh_timer.stop()
-            self._ssh_timer = None
+        self._stop_ssh_notifier()
 
         if self.terminal._pty:
             self.terminal._pty.close()
@@ -458,8 +508,7 @@ class TerminalWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Clean up on window close."""
-        if self._ssh_timer:
-            self._ssh_timer.stop()
+        self._stop_ssh_notifier()
         if self.terminal._pty:
             self.terminal._pty.terminate()
         super().closeEvent(event)
@@ -488,11 +537,11 @@ class TerminalWindow(QMainWindow):
             key_passphrase: Passphrase for encrypted key
             auth_method: Explicit auth method ("password", "key", "agent")
         """
+        from .config_manager import DEFAULT_USER
         from .ssh_dialog import SSHConnectionInfo
-        import os
 
         if username is None:
-            username = os.environ.get('USER', '')
+            username = DEFAULT_USER
 
         if auth_method is None:
             if key_file:
@@ -136,15 +136,11 @@ class GPUTextWidget(QOpenGLWidget):
         """Called when grid dimensions change. Override in subclass."""
         if self.buffer:
             # Recreate buffer with new size, preserving content
-            old_lines = self.buffer.lines
+            old_buffer = self.buffer
             self.buffer = TextBuffer(self.rows, self.cols)
             
-            if old_lines:
-                text = '\n'.join(
-                    ''.join(c.char for c in line.cells).rstrip() 
-                    for line in old_lines
-                )
-                self.buffer.load_text(text)
+            if old_buffer.total_lines:
+                self.buffer.load_text(old_buffer.get_text())
             
             self._emit_scroll_state()
     